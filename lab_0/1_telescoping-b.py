@@ -26,11 +26,16 @@ Final: T(8) = 1 + 2 + 3 + 4 + 5 + 6 + 7 + 8 = 36
 ```
 """
 
-import time
-import matplotlib.pyplot as plt
-import numpy as np
-from typing import List, Tuple
-import pandas as pd
+import os
+import sys
+import timeit
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import List
+
+# matplotlib and numpy are imported inside the functions that use them, so
+# the text-only demonstrations start without paying for them
 
 class TelescopingVisualizer:
     """
@@ -46,83 +51,153 @@ class TelescopingVisualizer:
         self.expansion_steps = []
         self.computation_trace = []
 
+@dataclass
+class TelescopingContext:
+    """
+    Values shared by every demonstration stage for a single n
+    """
+    n: int
+    prefix_sums: List[int]   # prefix_sums[i-1] = 1 + 2 + ... + i
+    closed_form: int         # n(n+1)/2
+    
+    @classmethod
+    def for_n(cls, n: int):
+        """Compute the running sums and closed form once"""
+        prefix_sums = list(accumulate(range(1, n + 1)))
+        return cls(n, prefix_sums, n * (n + 1) // 2)
+
 def print_separator(char="=", length=70):
     """Helper function to print separators"""
     print(char * length)
 
-def recursive_sum_traced(n, depth=0, trace_list=None):
+# --noninteractive (or NONINTERACTIVE=1) runs the demo without a terminal,
+# e.g. for timing: pauses return at once
+NONINTERACTIVE = (os.environ.get("NONINTERACTIVE", "").lower() in {"1", "true", "yes"}
+                  or "--noninteractive" in sys.argv)
+
+def pause(message):
+    """Wait for Enter between sections, but only when a user is at the terminal"""
+    if NONINTERACTIVE or not sys.stdin.isatty():
+        return
+    input(message)
+
+# The trace holds one indented line per call, so its size grows as n²;
+# larger n is refused rather than traced
+TRACE_MAX_N = 2000
+
+def recursive_sum_traced(n, depth=0, trace=None):
     """
     Recursive sum with detailed tracing to show actual computation
-    """
-    if trace_list is None:
-        trace_list = []
-    
-    indent = "  " * depth
     
-    if n <= 1:
-        trace_list.append((depth, n, f"{indent}T(1) = 1"))
-        return 1, trace_list
-    
-    # Record the current call
-    trace_list.append((depth, n, f"{indent}T({n}) = T({n-1}) + {n}"))
-    
-    # Recursive call
-    result_recursive, _ = recursive_sum_traced(n-1, depth+1, trace_list)
-    
-    # Compute result
-    result = result_recursive + n
-    trace_list.append((depth, n, f"{indent}T({n}) = {result_recursive} + {n} = {result}"))
-    
-    return result, trace_list
+    The trace is stored column-wise as (depths, values, messages): depths and
+    values are packed int64 arrays, messages holds the display strings.
+    Raises ValueError for n above TRACE_MAX_N.
+    """
+    if n > TRACE_MAX_N:
+        raise ValueError(f"recursive_sum_traced supports n <= {TRACE_MAX_N}, got {n}")
+    if trace is None:
+        trace = (array('q'), array('q'), [])
+    depths, values, messages = trace
+    
+    # Every call above the base case records two entries and the base case
+    # records one, so the whole trace can be allocated before recursing
+    size = 2 * max(n, 1) - 1
+    pos = len(messages)
+    depths.extend(array('q', [0]) * size)
+    values.extend(array('q', [0]) * size)
+    messages.extend([None] * size)
+    indents = ["  " * d for d in range(depth, depth + max(n, 1))]
+    
+    def record(level, value, message):
+        nonlocal pos
+        depths[pos] = depth + level
+        values[pos] = value
+        messages[pos] = message
+        pos += 1
+    
+    def traced(n, level):
+        indent = indents[level]
+        
+        if n <= 1:
+            record(level, n, f"{indent}T(1) = 1")
+            return 1
+        
+        # Record the current call
+        record(level, n, f"{indent}T({n}) = T({n-1}) + {n}")
+        
+        # Recursive call
+        result_recursive = traced(n-1, level+1)
+        
+        # Compute result
+        result = result_recursive + n
+        record(level, n, f"{indent}T({n}) = {result_recursive} + {n} = {result}")
+        
+        return result
+    
+    # traced() uses one frame per level; only raise the limit when n needs
+    # it, and put it back afterwards
+    old_limit = sys.getrecursionlimit()
+    if n > old_limit - 100:
+        sys.setrecursionlimit(n + 500)
+    try:
+        return traced(n, 0), trace
+    finally:
+        sys.setrecursionlimit(old_limit)
 
-def demonstrate_telescoping_expansion(n: int):
+def demonstrate_telescoping_expansion(n: int, ctx: TelescopingContext = None):
     """
     Show the telescoping expansion step by step
     """
-    print_separator("=")
-    print(f"TELESCOPING METHOD: Step-by-Step Expansion for T(n) = T(n-1) + n")
-    print(f"Solving for n = {n}")
-    print_separator("=")
+    if ctx is None:
+        ctx = TelescopingContext.for_n(n)
     
-    print("\n📝 Step 1: Write the original recurrence")
-    print(f"   T({n}) = T({n-1}) + {n}")
+    out = []
+    out.append("=" * 70)
+    out.append(f"TELESCOPING METHOD: Step-by-Step Expansion for T(n) = T(n-1) + n")
+    out.append(f"Solving for n = {n}")
+    out.append("=" * 70)
     
-    print("\n📝 Step 2: Expand T(n-1)")
-    print(f"   T({n-1}) = T({n-2}) + {n-1}")
-    print(f"   So: T({n}) = [T({n-2}) + {n-1}] + {n}")
-    print(f"       T({n}) = T({n-2}) + {n-1} + {n}")
+    out.append("\n📝 Step 1: Write the original recurrence")
+    out.append(f"   T({n}) = T({n-1}) + {n}")
     
-    print("\n📝 Step 3: Continue expanding...")
+    out.append("\n📝 Step 2: Expand T(n-1)")
+    out.append(f"   T({n-1}) = T({n-2}) + {n-1}")
+    out.append(f"   So: T({n}) = [T({n-2}) + {n-1}] + {n}")
+    out.append(f"       T({n}) = T({n-2}) + {n-1} + {n}")
+    
+    out.append("\n📝 Step 3: Continue expanding...")
+    
+    # Term strings "1".."n", built once and sliced for every step below
+    all_terms = [str(i) for i in range(1, n+1)]
     
     # Show progressive expansion
-    terms = []
     for i in range(min(4, n-1)):  # Show first 4 expansions
         remaining = n - i - 1
-        current_terms = [str(n-j) for j in range(i+1)]
-        terms_str = " + ".join(current_terms)
+        terms_str = " + ".join(reversed(all_terms[n-i-1:n]))
         
         if remaining > 1:
-            print(f"   Step 3.{i+1}: T({n}) = T({remaining}) + {terms_str}")
+            out.append(f"   Step 3.{i+1}: T({n}) = T({remaining}) + {terms_str}")
         else:
-            print(f"   Step 3.{i+1}: T({n}) = T(1) + {terms_str}")
+            out.append(f"   Step 3.{i+1}: T({n}) = T(1) + {terms_str}")
     
     if n > 5:
-        print(f"   ...")
+        out.append(f"   ...")
     
     # Final expansion
-    print(f"\n📝 Step 4: Complete expansion (base case T(1) = 1)")
-    all_terms = [str(i) for i in range(1, n+1)]
-    print(f"   T({n}) = {' + '.join(all_terms)}")
+    out.append(f"\n📝 Step 4: Complete expansion (base case T(1) = 1)")
+    out.append(f"   T({n}) = {' + '.join(all_terms)}")
     
     # Calculate sum
-    print(f"\n📝 Step 5: Calculate the sum")
-    print(f"   T({n}) = 1 + 2 + 3 + ... + {n}")
-    print(f"   T({n}) = Σ(i) from i=1 to {n}")
-    print(f"   T({n}) = n(n+1)/2")
-    print(f"   T({n}) = {n}×{n+1}/2")
-    print(f"   T({n}) = {n*(n+1)//2}")
-    
-    return n * (n + 1) // 2
+    out.append(f"\n📝 Step 5: Calculate the sum")
+    out.append(f"   T({n}) = 1 + 2 + 3 + ... + {n}")
+    out.append(f"   T({n}) = Σ(i) from i=1 to {n}")
+    out.append(f"   T({n}) = n(n+1)/2")
+    out.append(f"   T({n}) = {n}×{n+1}/2")
+    out.append(f"   T({n}) = {ctx.closed_form}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    
+    return ctx.closed_form
 
 def visualize_telescoping_cancellation(n: int):
     """
@@ -153,23 +228,27 @@ def visualize_telescoping_cancellation(n: int):
     print(f"   Right side: f(2) + f(3) + ... + f({n})")
     print(f"\n✨ Result: T(n) = T(1) + Σf(i) from i=2 to {n}")
 
-def create_step_by_step_table(n: int):
+def create_step_by_step_table(n: int, ctx: TelescopingContext = None):
     """
     Create a table showing the step-by-step calculation
     """
-    print_separator("=")
-    print(f"STEP-BY-STEP CALCULATION TABLE for n = {n}")
-    print_separator("=")
+    if ctx is None:
+        ctx = TelescopingContext.for_n(n)
+    
+    out = []
+    out.append("=" * 70)
+    out.append(f"STEP-BY-STEP CALCULATION TABLE for n = {n}")
+    out.append("=" * 70)
     
     # Build the table data
     data = []
     cumulative_sum = 0
     
-    print("\n| Step | Current Term | Cumulative Sum | Calculation |")
-    print("|------|-------------|----------------|-------------|")
+    out.append("\n| Step | Current Term | Cumulative Sum | Calculation |")
+    out.append("|------|-------------|----------------|-------------|")
     
     for i in range(1, n+1):
-        cumulative_sum += i
+        cumulative_sum = ctx.prefix_sums[i-1]
         calculation = f"{cumulative_sum-i} + {i}"
         if i == 1:
             calculation = "1"
@@ -181,12 +260,14 @@ def create_step_by_step_table(n: int):
             'Calculation': calculation
         })
         
-        print(f"| {i:4} | {i:11} | {cumulative_sum:14} | {calculation:11} |")
+        out.append(f"| {i:4} | {i:11} | {cumulative_sum:14} | {calculation:11} |")
     
-    print(f"\n✅ Final result: T({n}) = {cumulative_sum}")
-    print(f"✅ Formula check: n(n+1)/2 = {n}×{n+1}/2 = {n*(n+1)//2}")
+    out.append(f"\n✅ Final result: T({n}) = {cumulative_sum}")
+    out.append(f"✅ Formula check: n(n+1)/2 = {n}×{n+1}/2 = {ctx.closed_form}")
     
-    return pd.DataFrame(data)
+    sys.stdout.write("\n".join(out) + "\n")
+    
+    return data
 
 def visualize_expansion_tree(n: int):
     """
@@ -219,6 +300,8 @@ def compare_recursive_vs_formula(max_n: int = 20):
     """
     Compare recursive calculation with formula
     """
+    import numpy as np
+    
     print_separator("=")
     print("COMPARING RECURSIVE CALCULATION VS FORMULA")
     print_separator("=")
@@ -229,17 +312,21 @@ def compare_recursive_vs_formula(max_n: int = 20):
     recursive_times = []
     formula_times = []
     
+    # Every running sum 1 + 2 + ... + n in one pass
+    cumulative = np.arange(1, max_n + 1, dtype=np.int64).cumsum()
+    
+    # A single call takes about as long as reading the clock, so time a batch
+    repeats = 10000
+    
     for n in range(1, min(max_n + 1, 21)):
         # Recursive calculation with timing
-        start = time.perf_counter()
-        recursive_result = sum(range(1, n+1))  # Simpler for timing
-        recursive_time = time.perf_counter() - start
+        recursive_result = int(cumulative[n-1])
+        recursive_time = timeit.timeit(lambda n=n: sum(range(1, n+1)), number=repeats) / repeats
         recursive_times.append(recursive_time * 1000000)  # Convert to microseconds
         
         # Formula calculation with timing
-        start = time.perf_counter()
         formula_result = n * (n + 1) // 2
-        formula_time = time.perf_counter() - start
+        formula_time = timeit.timeit(lambda n=n: n * (n + 1) // 2, number=repeats) / repeats
         formula_times.append(formula_time * 1000000)
         
         match = "✓" if recursive_result == formula_result else "✗"
@@ -252,18 +339,22 @@ def plot_complexity_analysis():
     """
     Create visual plots showing the O(n²) complexity
     """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
     print_separator("=")
     print("COMPLEXITY ANALYSIS PLOTS")
     print_separator("=")
     
     # Generate data
     n_values = np.array([5, 10, 15, 20, 25, 30, 35, 40])
-    actual_values = [n * (n + 1) // 2 for n in n_values]
+    actual_values = n_values * (n_values + 1) // 2
     n_squared = n_values ** 2
     n_squared_half = n_squared / 2
     
-    # Create figure with subplots
-    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    # Create figure with subplots, reusing the window from an earlier call
+    fig = plt.figure(num='complexity', figsize=(12, 10), clear=True, constrained_layout=True)
+    axes = fig.subplots(2, 2)
     
     # Plot 1: Actual values
     axes[0, 0].plot(n_values, actual_values, 'bo-', label='T(n) = n(n+1)/2', linewidth=2)
@@ -310,26 +401,28 @@ def plot_complexity_analysis():
     ax2.set_ylabel('Cumulative sum', color='r')
     ax2.tick_params(axis='y', labelcolor='r')
     
-    plt.suptitle('Telescoping Method: T(n) = T(n-1) + n Analysis', fontsize=14, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle('Telescoping Method: T(n) = T(n-1) + n Analysis', fontsize=14, fontweight='bold')
+    fig.canvas.draw_idle()
     plt.show()
 
-def trace_actual_recursion(n: int):
+def trace_actual_recursion(n: int, ctx: TelescopingContext = None):
     """
     Trace the actual recursive calls showing the call stack
     """
+    if ctx is None:
+        ctx = TelescopingContext.for_n(n)
+    
     print_separator("=")
     print(f"ACTUAL RECURSION TRACE for n = {n}")
     print_separator("=")
     
-    result, trace = recursive_sum_traced(n)
+    result, (_, _, messages) = recursive_sum_traced(n)
     
     print("\n📞 Call Stack Trace:")
-    for depth, value, message in trace:
-        print(message)
+    sys.stdout.write("\n".join(messages) + "\n")
     
     print(f"\n✅ Final result: {result}")
-    print(f"✅ Formula verification: {n}×({n}+1)/2 = {n*(n+1)//2}")
+    print(f"✅ Formula verification: {n}×({n}+1)/2 = {ctx.closed_form}")
 
 def main():
     """
@@ -341,30 +434,31 @@ def main():
     
     # Choose n value for demonstration
     n = 8
+    ctx = TelescopingContext.for_n(n)
     
     # 1. Show step-by-step expansion
-    result1 = demonstrate_telescoping_expansion(n)
-    input("\n[Press Enter to continue to cancellation visualization...]")
+    result1 = demonstrate_telescoping_expansion(n, ctx)
+    pause("\n[Press Enter to continue to cancellation visualization...]")
     
     # 2. Show telescoping cancellation concept
     visualize_telescoping_cancellation(n)
-    input("\n[Press Enter to continue to calculation table...]")
+    pause("\n[Press Enter to continue to calculation table...]")
     
     # 3. Create calculation table
-    df = create_step_by_step_table(n)
-    input("\n[Press Enter to continue to expansion tree...]")
+    create_step_by_step_table(n, ctx)
+    pause("\n[Press Enter to continue to expansion tree...]")
     
     # 4. Show expansion tree
     visualize_expansion_tree(n)
-    input("\n[Press Enter to continue to recursion trace...]")
+    pause("\n[Press Enter to continue to recursion trace...]")
     
     # 5. Trace actual recursion
-    trace_actual_recursion(n)
-    input("\n[Press Enter to continue to comparison...]")
+    trace_actual_recursion(n, ctx)
+    pause("\n[Press Enter to continue to comparison...]")
     
     # 6. Compare recursive vs formula
     compare_recursive_vs_formula(15)
-    input("\n[Press Enter to see complexity plots...]")
+    pause("\n[Press Enter to see complexity plots...]")
     
     # 7. Plot complexity analysis
     plot_complexity_analysis()
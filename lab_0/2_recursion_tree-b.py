@@ -21,11 +21,17 @@
 
 import math
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch
 from typing import List, Tuple, Dict
+import sys
 import time
+from functools import lru_cache
+from collections import defaultdict
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; run as plain Python without it
+    HAVE_NUMBA = False
 
 class RecursionTreeVisualizer:
     """
@@ -40,6 +46,71 @@ class RecursionTreeVisualizer:
         self.tree_data = []
         self.execution_trace = []
 
+class TraceBuf:
+    """
+    Recursion trace stored as parallel columns (depths, sizes, works,
+    counts) instead of one dict per call; anything else an algorithm
+    records goes in the matching slot of extras. A row stands for `count`
+    identical calls, so an algorithm whose calls on a level all look the
+    same can record the level as a single row. Work is kept as float64 so
+    large levels (n^3 at n = 2^21 and up) cannot overflow.
+    
+    The labs run standalone, so 2_recursion_tree-b.py and
+    3_master_method-b.py each carry this class; keep the two copies identical.
+    """
+    
+    def __init__(self, capacity=64):
+        self.depths = np.empty(capacity, dtype=np.int32)
+        self.sizes = np.empty(capacity, dtype=np.int32)
+        self.works = np.empty(capacity, dtype=np.float64)
+        self.counts = np.empty(capacity, dtype=np.int64)
+        self.extras = []
+        self.idx = 0
+    
+    def append(self, depth, size, work, extra=None, count=1):
+        """Record one call (or count identical calls) as indexed stores"""
+        if self.idx == len(self.depths):
+            self._grow()
+        i = self.idx
+        self.depths[i] = depth
+        self.sizes[i] = size
+        self.works[i] = work
+        self.counts[i] = count
+        self.extras.append(extra)
+        self.idx = i + 1
+    
+    def extend(self, depths, sizes, works, extras):
+        """Record a batch of calls given as equal-length columns"""
+        end = self.idx + len(extras)
+        while end > len(self.depths):
+            self._grow()
+        self.depths[self.idx:end] = depths
+        self.sizes[self.idx:end] = sizes
+        self.works[self.idx:end] = works
+        self.counts[self.idx:end] = 1
+        self.extras.extend(extras)
+        self.idx = end
+    
+    def _grow(self):
+        capacity = 2 * max(len(self.depths), 1)
+        for name in ('depths', 'sizes', 'works', 'counts'):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.idx] = column[:self.idx]
+            setattr(self, name, grown)
+    
+    def __len__(self):
+        return self.idx
+    
+    def work_by_depth(self):
+        """Total work at each depth, indexed by depth"""
+        work = self.works[:self.idx] * self.counts[:self.idx]
+        return np.bincount(self.depths[:self.idx], weights=work)
+    
+    def calls_by_depth(self):
+        """Number of recorded calls at each depth, indexed by depth"""
+        return np.bincount(self.depths[:self.idx], weights=self.counts[:self.idx]).astype(np.int64)
+
 def print_separator(char="=", length=70, title=""):
     """Helper function to print separators with optional title"""
     if title:
@@ -48,61 +119,81 @@ def print_separator(char="=", length=70, title=""):
     else:
         print(char * length)
 
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def merge_runs(src, tgt, start, mid, end):
+        """
+        Merge the sorted runs src[start:mid] and src[mid:end] into tgt[start:end]
+        """
+        i = start
+        j = mid
+        for k in range(start, end):
+            if i < mid and (j >= end or src[i] <= src[j]):
+                tgt[k] = src[i]
+                i += 1
+            else:
+                tgt[k] = src[j]
+                j += 1
+else:
+    # Without numba the element loop would run in the interpreter, so
+    # let NumPy's stable sort (a C merge) combine the two runs instead
+    def merge_runs(src, tgt, start, mid, end):
+        tgt[start:end] = np.sort(src[start:end], kind='stable')
+
 def actual_merge_sort(arr, depth=0, trace=None, side="root"):
     """
     Actual merge sort implementation with tracing
+    
+    The recursion only drives the split and records the trace; the values
+    live in one shared buffer and every merge runs in the compiled kernel.
+    Trace rows keep just the [lo, hi) range of arr they cover; use
+    render_merge_trace to turn a row back into its printed line.
     """
     if trace is None:
-        trace = []
+        trace = TraceBuf(3 * max(len(arr), 1))
     
-    n = len(arr)
-    indent = "  " * depth
-    
-    # Record the call
-    trace.append({
-        'depth': depth,
-        'size': n,
-        'array': arr.copy(),
-        'side': side,
-        'work': n,  # Work for merging
-        'message': f"{indent}merge_sort({arr})"
-    })
-    
-    if n <= 1:
-        return arr, trace
-    
-    # Split
-    mid = n // 2
-    left_arr = arr[:mid]
-    right_arr = arr[mid:]
-    
-    # Recursive calls
-    left_sorted, _ = actual_merge_sort(left_arr, depth + 1, trace, "left")
-    right_sorted, _ = actual_merge_sort(right_arr, depth + 1, trace, "right")
-    
-    # Merge
-    merged = []
-    i = j = 0
-    while i < len(left_sorted) and j < len(right_sorted):
-        if left_sorted[i] <= right_sorted[j]:
-            merged.append(left_sorted[i])
-            i += 1
-        else:
-            merged.append(right_sorted[j])
-            j += 1
-    merged.extend(left_sorted[i:])
-    merged.extend(right_sorted[j:])
-    
-    trace.append({
-        'depth': depth,
-        'size': n,
-        'array': merged,
-        'side': side,
-        'work': n,
-        'message': f"{indent}merged: {merged}"
-    })
-    
-    return merged, trace
+    data = np.array(arr)
+    scratch = np.empty_like(data)
+    
+    def sort_range(start, end, depth, side):
+        n = end - start
+        
+        # Record the call (work for merging is n)
+        trace.append(depth, n, n, {'lo': start, 'hi': end, 'side': side, 'merged': False})
+        
+        if n <= 1:
+            return
+        
+        # Split
+        mid = start + n // 2
+        
+        # Recursive calls
+        sort_range(start, mid, depth + 1, "left")
+        sort_range(mid, end, depth + 1, "right")
+        
+        # Merge
+        scratch[start:end] = data[start:end]
+        merge_runs(scratch, data, start, mid, end)
+        
+        trace.append(depth, n, n, {'lo': start, 'hi': end, 'side': side, 'merged': True})
+    
+    sort_range(0, len(data), depth, side)
+    
+    return data.tolist(), trace
+
+# Merge sort depth is log2(n), so 64 levels covers any array that fits in memory
+INDENTS = ["  " * depth for depth in range(64)]
+
+def render_merge_trace(trace, i, arr):
+    """
+    Printed line for row i of an actual_merge_sort trace over the input arr
+    """
+    extra = trace.extras[i]
+    chunk = list(arr[extra['lo']:extra['hi']])
+    indent = INDENTS[int(trace.depths[i])]
+    if extra['merged']:
+        return f"{indent}merged: {sorted(chunk)}"
+    return f"{indent}merge_sort({chunk})"
 
 def visualize_tree_ascii(n, a=2, b=2, show_work=True):
     """
@@ -110,6 +201,8 @@ def visualize_tree_ascii(n, a=2, b=2, show_work=True):
     """
     print_separator("=", title=f"RECURSION TREE for T(n) = {a}T(n/{b}) + n")
     
+    out = []
+    
     def draw_node(size, depth, position="center", is_leaf=False):
         """Draw a single node with connections"""
         indent = "    " * depth
@@ -127,39 +220,43 @@ def visualize_tree_ascii(n, a=2, b=2, show_work=True):
         
         return indent + node_str
     
-    def build_tree(size, depth=0, max_depth=5):
-        """Recursively build the tree"""
-        if depth >= max_depth or size < 1:
-            return []
-        
+    def build_tree(size, max_depth=5, max_lines=None):
+        """Build the tree lines in preorder, stopping once max_lines are produced"""
         nodes = []
-        is_leaf = (size <= 1) or (depth == max_depth - 1)
+        stack = [(size, 0)]
         
-        # Current node
-        nodes.append(draw_node(size, depth, is_leaf=is_leaf))
-        
-        if not is_leaf:
-            # Draw branches
-            indent = "    " * depth
-            nodes.append(indent + "  ├─┬─" + "─" * 10)
+        while stack and (max_lines is None or len(nodes) < max_lines):
+            size, depth = stack.pop()
+            if depth >= max_depth or size < 1:
+                continue
+            
+            is_leaf = (size <= 1) or (depth == max_depth - 1)
+            
+            # Current node
+            nodes.append(draw_node(size, depth, is_leaf=is_leaf))
             
-            # Recursive calls
-            for i in range(a):
-                child_size = size / b
-                child_nodes = build_tree(child_size, depth + 1, max_depth)
-                nodes.extend(child_nodes)
+            if not is_leaf:
+                # Draw branches
+                indent = "    " * depth
+                nodes.append(indent + "  ├─┬─" + "─" * 10)
+                
+                # Children are identical, so push order doesn't matter
+                stack.extend([(size / b, depth + 1)] * a)
         
         return nodes
     
-    print(f"\n🌳 Tree Structure (n = {n}):")
-    print("=" * 60)
+    out.append(f"\n🌳 Tree Structure (n = {n}):")
+    out.append("=" * 60)
     
-    tree_lines = build_tree(n)
+    # One line past the display limit is enough to know the tree continues
+    tree_lines = build_tree(n, max_lines=21)
     for line in tree_lines[:20]:  # Limit output
-        print(line)
+        out.append(line)
     
     if len(tree_lines) > 20:
-        print("    ... (tree continues)")
+        out.append("    ... (tree continues)")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def step_by_step_tree_construction(n, a=2, b=2):
     """
@@ -167,40 +264,29 @@ def step_by_step_tree_construction(n, a=2, b=2):
     """
     print_separator("=", title="STEP-BY-STEP TREE CONSTRUCTION")
     
-    print(f"\nBuilding tree for: T(n) = {a}T(n/{b}) + n")
-    print(f"Starting with n = {n}")
+    out = []
+    out.append(f"\nBuilding tree for: T(n) = {a}T(n/{b}) + n")
+    out.append(f"Starting with n = {n}")
     
     levels_data = []
-    current_level = [(n, 1)]  # (size, count)
+    # Every node on a level has the same size, so one (size, count) pair
+    # describes the whole level
+    size, total_nodes = n, 1
     level = 0
     
-    print("\n📊 Level-by-Level Analysis:")
-    print("-" * 70)
+    out.append("\n📊 Level-by-Level Analysis:")
+    out.append("-" * 70)
     
-    while current_level and level < 10:  # Limit depth
+    while size >= 1 and level < 10:  # Limit depth
         # Calculate work at this level
-        level_sizes = []
-        level_work_items = []
-        total_nodes = 0
-        
-        for size, count in current_level:
-            if size >= 1:
-                total_nodes += count
-                for _ in range(count):
-                    level_sizes.append(size)
-                    level_work_items.append(size)
-        
-        if not level_sizes:
-            break
-            
-        level_work = sum(level_work_items)
+        level_work = total_nodes * size
         
         # Display level information
-        print(f"\n🔹 Level {level}:")
-        print(f"   Number of nodes: {total_nodes}")
-        print(f"   Node sizes: {[f'{s:.1f}' for s in sorted(set(level_sizes), reverse=True)]}")
-        print(f"   Work per node: {level_sizes[0] if level_sizes else 0:.1f}")
-        print(f"   Total work at level: {level_work:.1f}")
+        out.append(f"\n🔹 Level {level}:")
+        out.append(f"   Number of nodes: {total_nodes}")
+        out.append(f"   Node sizes: {[f'{size:.1f}']}")
+        out.append(f"   Work per node: {size:.1f}")
+        out.append(f"   Total work at level: {level_work:.1f}")
         
         # Visual bar for work
         max_bar_width = 40
@@ -208,41 +294,32 @@ def step_by_step_tree_construction(n, a=2, b=2):
             max_work = level_work
         bar_width = int((level_work / max_work) * max_bar_width) if max_work > 0 else 0
         bar = "█" * bar_width + "░" * (max_bar_width - bar_width)
-        print(f"   Work distribution: [{bar}] {level_work:.1f}")
+        out.append(f"   Work distribution: [{bar}] {level_work:.1f}")
         
         levels_data.append({
             'level': level,
             'nodes': total_nodes,
             'work': level_work,
-            'sizes': level_sizes
+            'size': size
         })
         
-        # Prepare next level
-        next_level = []
-        for size, count in current_level:
-            if size > 1:
-                child_size = size / b
-                for _ in range(count):
-                    for _ in range(a):
-                        next_level.append((child_size, 1))
-        
-        # Consolidate counts for same sizes
-        size_counts = {}
-        for size, count in next_level:
-            if size not in size_counts:
-                size_counts[size] = 0
-            size_counts[size] += count
-        
-        current_level = list(size_counts.items())
+        # Prepare next level: only nodes larger than 1 split
+        if size <= 1:
+            break
+        size /= b
+        total_nodes *= a
         level += 1
     
     # Summary
-    print("\n" + "=" * 70)
-    print("📈 SUMMARY:")
+    out.append("\n" + "=" * 70)
+    out.append("📈 SUMMARY:")
     total_work = sum(ld['work'] for ld in levels_data)
-    print(f"   Total levels: {len(levels_data)}")
-    print(f"   Total work: {total_work:.1f}")
-    print(f"   Theoretical: n * log₂(n) = {n} * {math.log2(n):.1f} = {n * math.log2(n):.1f}")
+    out.append(f"   Total levels: {len(levels_data)}")
+    out.append(f"   Total work: {total_work:.1f}")
+    log2n = math.log2(n)
+    out.append(f"   Theoretical: n * log₂(n) = {n} * {log2n:.1f} = {n * log2n:.1f}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     return levels_data
 
@@ -259,17 +336,18 @@ def compare_with_actual_execution(arr):
     # Run actual merge sort with tracing
     sorted_arr, trace = actual_merge_sort(arr)
     
-    # Analyze trace by depth
-    depth_analysis = {}
-    for item in trace:
-        depth = item['depth']
-        if depth not in depth_analysis:
-            depth_analysis[depth] = {
-                'calls': [],
-                'work': 0
-            }
-        depth_analysis[depth]['calls'].append(item)
-        depth_analysis[depth]['work'] += item['work']
+    # Analyze trace by depth: the totals come straight from the trace columns
+    calls_by_depth = trace.calls_by_depth()
+    work_by_depth = trace.work_by_depth()
+    rows_by_depth = defaultdict(list)
+    for i, depth in enumerate(trace.depths[:len(trace)].tolist()):
+        rows_by_depth[depth].append(i)
+    
+    # Only the first 5 calls at each depth are printed
+    depth_analysis = {
+        depth: {'calls': calls, 'work': int(work_by_depth[depth]), 'shown': rows_by_depth[depth][:5]}
+        for depth, calls in enumerate(calls_by_depth.tolist()) if calls
+    }
     
     print("\n🔄 Actual Execution Trace:")
     print("-" * 70)
@@ -278,11 +356,11 @@ def compare_with_actual_execution(arr):
         calls = depth_analysis[depth]['calls']
         work = depth_analysis[depth]['work']
         
-        print(f"\nDepth {depth}: ({len(calls)} operations)")
-        for call in calls[:5]:  # Show first 5 calls at each depth
-            print(f"  {call['message']}")
-        if len(calls) > 5:
-            print(f"  ... and {len(calls) - 5} more")
+        print(f"\nDepth {depth}: ({calls} operations)")
+        for i in depth_analysis[depth]['shown']:
+            print(f"  {render_merge_trace(trace, i, arr)}")
+        if calls > 5:
+            print(f"  ... and {calls - 5} more")
         print(f"  Total work at depth {depth}: {work}")
     
     print(f"\n✅ Sorted array: {sorted_arr}")
@@ -293,53 +371,83 @@ def visualize_tree_graphically(n, a=2, b=2, title="Recursion Tree"):
     """
     Create a graphical visualization of the recursion tree using matplotlib
     """
+    # matplotlib is only needed for this plot, so the text-only options
+    # don't pay for importing it
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import EllipseCollection, LineCollection
+    
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 8))
+    log2n = math.log2(n)
+    
+    # Wide trees would put a**4 overlapping nodes in the plot; keep the
+    # deepest level drawn within the render budget
+    render_budget = 256
+    max_level = min(4, int(math.log(render_budget) / math.log(max(a, 2))))
     
     # Left plot: Tree structure
-    ax1.set_title(f"{title}\nT(n) = {a}T(n/{b}) + n", fontsize=14, fontweight='bold')
+    tree_title = f"{title}\nT(n) = {a}T(n/{b}) + n"
+    if max_level < 4:
+        tree_title += f"\n(depth capped at {max_level} for {a}-ary tree)"
+    ax1.set_title(tree_title, fontsize=14, fontweight='bold')
     ax1.set_xlim(-1, 10)
     ax1.set_ylim(-1, 6)
     ax1.axis('off')
     
-    def draw_tree_node(ax, x, y, size, level, max_level=4):
-        """Recursively draw tree nodes"""
-        if level > max_level or size < 1:
-            return
+    def draw_tree(ax, x, y, size, max_level=4):
+        """Lay the tree out level by level, then draw it with one collection each for nodes and edges"""
+        node_xs, node_ys, node_sizes, node_levels, edges = [], [], [], [], []
+        xs = np.array([float(x)])
         
-        # Node color based on level
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
-        color = colors[level % len(colors)]
+        for level in range(max_level + 1):
+            if size < 1:
+                break
+            node_xs.append(xs)
+            node_ys.append(np.full_like(xs, y))
+            node_sizes.append(np.full_like(xs, size))
+            node_levels.append(np.full(len(xs), level))
+            
+            if level == max_level or size <= 1:
+                break
+            
+            # Children of every node on this level at once
+            spacing = 3 / (2 ** level)
+            child_xs = (xs[:, None] + (np.arange(a) - (a-1)/2) * spacing).ravel()
+            parent_xs = np.repeat(xs, a)
+            edges.append(np.stack([
+                np.column_stack([parent_xs, np.full_like(parent_xs, y - 0.3)]),
+                np.column_stack([child_xs, np.full_like(child_xs, y - 1.2 + 0.3)]),
+            ], axis=1))
+            
+            xs = child_xs
+            y -= 1.2
+            size /= b
         
-        # Draw node
-        circle = patches.Circle((x, y), 0.3, color=color, ec='black', linewidth=2)
-        ax.add_patch(circle)
-        ax.text(x, y, f'{int(size)}', ha='center', va='center', fontweight='bold')
+        xs = np.concatenate(node_xs)
+        ys = np.concatenate(node_ys)
+        sizes = np.concatenate(node_sizes)
+        levels = np.concatenate(node_levels)
         
-        # Draw work annotation
-        ax.text(x, y - 0.5, f'w={int(size)}', ha='center', va='center', 
-                fontsize=8, style='italic')
+        # Node color based on level
+        colors = np.array(['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7'])
         
-        # Draw children
-        if level < max_level and size > 1:
-            child_size = size / b
-            spacing = 3 / (2 ** level)
-            
-            for i in range(a):
-                child_x = x + (i - (a-1)/2) * spacing
-                child_y = y - 1.2
-                
-                # Draw edge
-                ax.plot([x, child_x], [y - 0.3, child_y + 0.3], 
-                       'k-', linewidth=1, alpha=0.6)
-                
-                # Recursive call
-                draw_tree_node(ax, child_x, child_y, child_size, level + 1, max_level)
+        if edges:
+            ax.add_collection(LineCollection(np.concatenate(edges), colors='k', linewidths=1, alpha=0.6))
+        ax.add_collection(EllipseCollection(
+            0.6, 0.6, 0, units='xy', offsets=np.column_stack([xs, ys]),
+            offset_transform=ax.transData, facecolors=colors[levels % len(colors)],
+            edgecolors='black', linewidths=2))
+        
+        # Node labels and work annotations
+        for node_x, node_y, node_size in zip(xs, ys, sizes.astype(int)):
+            ax.text(node_x, node_y, f'{node_size}', ha='center', va='center', fontweight='bold')
+            ax.text(node_x, node_y - 0.5, f'w={node_size}', ha='center', va='center', 
+                    fontsize=8, style='italic')
     
     # Draw the tree
-    draw_tree_node(ax1, 5, 5, n, 0, 4)
+    draw_tree(ax1, 5, 5, n, max_level)
     
     # Add level labels
-    for level in range(5):
+    for level in range(max_level + 1):
         ax1.text(-0.5, 5 - level * 1.2, f'Level {level}', 
                 fontweight='bold', va='center')
     
@@ -351,7 +459,7 @@ def visualize_tree_graphically(n, a=2, b=2, title="Recursion Tree"):
     work_per_level = []
     total_work = 0
     
-    for level in range(int(math.log2(n)) + 1):
+    for level in range(int(log2n) + 1):
         num_nodes = a ** level
         node_size = n / (b ** level)
         level_work = num_nodes * node_size
@@ -378,7 +486,7 @@ def visualize_tree_graphically(n, a=2, b=2, title="Recursion Tree"):
     # Add total work annotation
     ax2.axhline(y=n, color='r', linestyle='--', alpha=0.5, label=f'n = {n}')
     ax2.text(len(levels) - 1, total_work * 1.1, 
-            f'Total Work = {total_work:.0f}\n= n × log₂(n) = {n * math.log2(n):.0f}',
+            f'Total Work = {total_work:.0f}\n= n × log₂(n) = {n * log2n:.0f}',
             ha='right', fontweight='bold', bbox=dict(boxstyle="round,pad=0.3", 
                                                      facecolor="yellow", alpha=0.5))
     ax2.legend()
@@ -387,6 +495,41 @@ def visualize_tree_graphically(n, a=2, b=2, title="Recursion Tree"):
     plt.tight_layout()
     plt.show()
 
+# Per-node work functions for the explorer's built-in recurrences. They are
+# module-level (not lambdas) so cached level tables can be keyed on them.
+def constant_work(x):
+    """f(n) = 1"""
+    return 1
+
+def linear_work(x):
+    """f(n) = n"""
+    return x
+
+def quadratic_work(x):
+    """f(n) = n²"""
+    return x**2
+
+@lru_cache(maxsize=128)
+def tree_level_table(a, b, f, n):
+    """
+    Level table for T(n) = a*T(n/b) + f(n): level ids, nodes, size per node,
+    work per node and total work per level, cached across explorer runs
+    """
+    max_levels = int(math.log(n) / math.log(b)) + 1
+    
+    # Every level at once: a^i nodes of size n/b^i
+    level_ids = np.arange(max_levels)
+    # Node counts stay Python ints: a^i outgrows int64 on deep custom trees
+    nodes_per_level = np.power(a, level_ids.astype(object))
+    sizes = n / np.power(float(b), level_ids)
+    work_per_node = np.broadcast_to(f(sizes), sizes.shape).astype(float)
+    level_works = (nodes_per_level * work_per_node).astype(float)
+    
+    table = (level_ids, nodes_per_level, sizes, work_per_node, level_works)
+    for column in table:
+        column.setflags(write=False)  # shared by every caller of the cache
+    return table
+
 def interactive_tree_explorer():
     """
     Interactive function to explore different recurrence relations
@@ -404,11 +547,11 @@ def interactive_tree_explorer():
     choice = input("\nSelect option (1-6): ").strip()
     
     configs = {
-        '1': (1, 2, lambda x: 1, "Binary Search"),
-        '2': (2, 2, lambda x: x, "Merge Sort"),
-        '3': (2, 2, lambda x: x, "Quick Sort (best case)"),
-        '4': (7, 2, lambda x: x**2, "Strassen's Algorithm"),
-        '5': (3, 2, lambda x: x, "Karatsuba Multiplication")
+        '1': (1, 2, constant_work, "Binary Search"),
+        '2': (2, 2, linear_work, "Merge Sort"),
+        '3': (2, 2, linear_work, "Quick Sort (best case)"),
+        '4': (7, 2, quadratic_work, "Strassen's Algorithm"),
+        '5': (3, 2, linear_work, "Karatsuba Multiplication")
     }
     
     if choice in configs:
@@ -417,64 +560,56 @@ def interactive_tree_explorer():
         a = int(input("Enter a (number of subproblems): "))
         b = int(input("Enter b (size reduction factor): "))
         name = "Custom Recurrence"
-        f = lambda x: x  # Default to linear
+        f = linear_work  # Default to linear
     
     n = int(input("Enter n (problem size, e.g., 16, 32, 64): "))
     
-    print(f"\n🎯 Analyzing: T(n) = {a}T(n/{b}) + f(n)")
+    out = []
+    out.append(f"\n🎯 Analyzing: T(n) = {a}T(n/{b}) + f(n)")
     
     # Detailed analysis
-    levels_data = []
-    level = 0
-    max_levels = int(math.log(n) / math.log(b)) + 1
-    
-    print("\n" + "="*80)
-    print(f"{'Level':<8} {'Nodes':<10} {'Size/Node':<12} {'Work/Node':<12} {'Total Work':<12} {'Visualization'}")
-    print("="*80)
-    
-    total_work = 0
-    max_work_level = 0
-    
-    for level in range(max_levels):
-        num_nodes = a ** level
-        size_per_node = n / (b ** level)
-        work_per_node = f(size_per_node)
-        level_work = num_nodes * work_per_node
-        total_work += level_work
-        
-        if level_work > max_work_level:
-            max_work_level = level_work
-        
-        # Create visualization bar
-        bar_width = int(30 * (level_work / max_work_level)) if max_work_level > 0 else 0
-        bar = "█" * bar_width + "░" * (30 - bar_width)
-        
-        print(f"{level:<8} {num_nodes:<10} {size_per_node:<12.2f} {work_per_node:<12.2f} {level_work:<12.2f} {bar}")
-        
-        levels_data.append({
-            'level': level,
-            'nodes': num_nodes,
-            'size': size_per_node,
-            'work': level_work
-        })
-    
-    print("="*80)
-    print(f"{'TOTAL':<8} {'':<10} {'':<12} {'':<12} {total_work:<12.2f}")
-    print("="*80)
+    level_ids, nodes_per_level, sizes, work_per_node, level_works = tree_level_table(a, b, f, n)
+    total_work = level_works.sum()
+    
+    out.append("\n" + "="*80)
+    out.append(f"{'Level':<8} {'Nodes':<10} {'Size/Node':<12} {'Work/Node':<12} {'Total Work':<12} {'Visualization'}")
+    out.append("="*80)
+    
+    # Bars are scaled to the largest level seen so far
+    running_max = np.maximum.accumulate(np.maximum(level_works, 0))
+    scale = np.where(running_max > 0, running_max, np.inf)
+    bar_widths = (30 * level_works / scale).astype(int)
+    bars = np.char.add(np.char.multiply("█", bar_widths), np.char.multiply("░", 30 - bar_widths))
+    
+    out.append("\n".join(
+        f"{level:<8} {num_nodes:<10} {size:<12.2f} {wpn:<12.2f} {work:<12.2f} {bar}"
+        for level, num_nodes, size, wpn, work, bar in zip(
+            level_ids, nodes_per_level, sizes, work_per_node, level_works, bars)
+    ))
+    
+    levels_data = [
+        {'level': level, 'nodes': num_nodes, 'size': size, 'work': work}
+        for level, num_nodes, size, work in zip(
+            level_ids.tolist(), nodes_per_level.tolist(), sizes.tolist(), level_works.tolist())
+    ]
+    
+    out.append("="*80)
+    out.append(f"{'TOTAL':<8} {'':<10} {'':<12} {'':<12} {total_work:<12.2f}")
+    out.append("="*80)
     
     # Complexity analysis
     log_b_a = math.log(a) / math.log(b)
-    print(f"\n📊 Complexity Analysis:")
-    print(f"   log_b(a) = log_{b}({a}) = {log_b_a:.3f}")
-    print(f"   Total work: {total_work:.2f}")
-    
-    # Determine Master Theorem case
-    if abs(log_b_a - 1) < 0.01:  # Case 2
-        print(f"   Complexity: O(n log n)")
-    elif log_b_a > 1:  # Case 1
-        print(f"   Complexity: O(n^{log_b_a:.2f})")
-    else:  # Case 3
-        print(f"   Complexity: O(n)")
+    out.append(f"\n📊 Complexity Analysis:")
+    out.append(f"   log_b(a) = log_{b}({a}) = {log_b_a:.3f}")
+    out.append(f"   Total work: {total_work:.2f}")
+    
+    # Determine Master Theorem case from where log_b(a) falls around 1:
+    # below is Case 3, within 0.01 is Case 2, above is Case 1
+    complexities = ("O(n)", "O(n log n)", f"O(n^{log_b_a:.2f})")
+    case = int(np.searchsorted([0.99, 1.01], log_b_a))
+    out.append(f"   Complexity: {complexities[case]}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     return levels_data
 
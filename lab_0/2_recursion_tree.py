@@ -1,23 +1,26 @@
 import math 
+import sys
+from functools import lru_cache
 import numpy as np 
 
+@lru_cache(maxsize=None)
 def merge_sort_work_calculator(n, depth=0):
     """Calculate work done by merge sort at each level"""
     if n <= 1:
-        return [(depth, 1)]
+        return ((depth, 1),)
     
-    work = [(depth, n)]  # Current level work
-    # Add work from left and right subtrees
-    work.extend(merge_sort_work_calculator(n//2, depth+1))
-    work.extend(merge_sort_work_calculator(n - n//2, depth+1))
-    
-    return work
+    # Current level work, then the left and right subtrees. Equal-sized
+    # subtrees at the same depth are computed once and shared via the cache.
+    return (((depth, n),)
+            + merge_sort_work_calculator(n//2, depth+1)
+            + merge_sort_work_calculator(n - n//2, depth+1))
 
 def visualize_recursion_tree():
     """Visualize the recursion tree for merge sort"""
-    print("\nRecursion Tree Method Demonstration")
-    print("Recurrence: T(n) = 2T(n/2) + n (Merge Sort)")
-    print("\nRecursion Tree Structure:")
+    out = []
+    out.append("\nRecursion Tree Method Demonstration")
+    out.append("Recurrence: T(n) = 2T(n/2) + n (Merge Sort)")
+    out.append("\nRecursion Tree Structure:")
     
     n = 16
     work = merge_sort_work_calculator(n)
@@ -29,8 +32,8 @@ def visualize_recursion_tree():
             depth_work[d] = []
         depth_work[d].append(w)
     
-    print(f"\nFor n = {n}:")
-    print("-" * 50)
+    out.append(f"\nFor n = {n}:")
+    out.append("-" * 50)
     total_work = 0
     
     for depth in sorted(depth_work.keys()):
@@ -42,14 +45,17 @@ def visualize_recursion_tree():
         indent = "  " * depth
         nodes = f"[{','.join(map(str, depth_work[depth]))}]"
         
-        print(f"Level {depth}: {indent}{nodes}")
-        print(f"         Work at level: {level_work} (from {num_nodes} nodes)")
+        out.append(f"Level {depth}: {indent}{nodes}")
+        out.append(f"         Work at level: {level_work} (from {num_nodes} nodes)")
     
-    print("-" * 50)
-    print(f"Total work: {total_work}")
-    print(f"Number of levels: {len(depth_work)} = log₂(n) + 1")
-    print(f"Work per level: n")
-    print(f"Total: n * log(n) = {n} * {np.log2(n):.0f} = {n * np.log2(n):.0f}")
+    out.append("-" * 50)
+    out.append(f"Total work: {total_work}")
+    out.append(f"Number of levels: {len(depth_work)} = log₂(n) + 1")
+    out.append(f"Work per level: n")
+    log2n = np.log2(n)
+    out.append(f"Total: n * log(n) = {n} * {log2n:.0f} = {n * log2n:.0f}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 visualize_recursion_tree()
 
@@ -65,15 +71,17 @@ def analyze_recurrence_tree(a, b, f_n, n):
     print("\nLevel | # Nodes | Work per Node | Total Work")
     print("-" * 50)
     
-    total_work = 0
+    # Every level at once: a^i nodes of size n/b^i
+    level_ids = np.arange(levels)
+    # Node counts stay Python ints: a^i outgrows int64 on deep trees
+    nodes_per_level = np.power(a, level_ids.astype(object))
+    sizes = n / np.power(float(b), level_ids)
+    work_per_node = np.broadcast_to(f_n(sizes), sizes.shape)
+    level_works = (nodes_per_level * work_per_node).astype(float)
+    total_work = level_works.sum()
+    
     for level in range(levels):
-        num_nodes = a ** level
-        size_at_level = n / (b ** level)
-        work_per_node = f_n(size_at_level)
-        level_work = num_nodes * work_per_node
-        total_work += level_work
-        
-        print(f"{level:5} | {num_nodes:7} | {work_per_node:13.2f} | {level_work:10.2f}")
+        print(f"{level:5} | {nodes_per_level[level]:7} | {work_per_node[level]:13.2f} | {level_works[level]:10.2f}")
     
     print("-" * 50)
     print(f"Total work: {total_work:.2f}")
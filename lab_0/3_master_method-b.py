@@ -40,12 +40,31 @@ Visual bars show work distribution patterns
 Compare theoretical predictions with actual execution
 """
 import math
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
 import time
+from functools import lru_cache, singledispatch
 from typing import List, Tuple, Callable
 import random
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; run as plain Python without it
+    HAVE_NUMBA = False
+
+# --noninteractive (or NONINTERACTIVE=1) runs the demo without a terminal,
+# e.g. for profiling: pauses return at once and the explorer is skipped
+NONINTERACTIVE = (os.environ.get("NONINTERACTIVE", "").lower() in {"1", "true", "yes"}
+                  or "--noninteractive" in sys.argv)
+
+def pause(message=""):
+    """Wait for Enter (returning what was typed) unless running non-interactively"""
+    if NONINTERACTIVE:
+        return ""
+    return input(message)
+
 def print_separator(char="=", length=70, title=""):
     """Helper function to print separators with optional title"""
     if title:
@@ -54,41 +73,140 @@ def print_separator(char="=", length=70, title=""):
     else:
         print(char * length)
 
+class TraceBuf:
+    """
+    Recursion trace stored as parallel columns (depths, sizes, works,
+    counts) instead of one dict per call; anything else an algorithm
+    records goes in the matching slot of extras. A row stands for `count`
+    identical calls, so an algorithm whose calls on a level all look the
+    same can record the level as a single row. Work is kept as float64 so
+    large levels (n^3 at n = 2^21 and up) cannot overflow.
+    
+    The labs run standalone, so 2_recursion_tree-b.py and
+    3_master_method-b.py each carry this class; keep the two copies identical.
+    """
+    
+    def __init__(self, capacity=64):
+        self.depths = np.empty(capacity, dtype=np.int32)
+        self.sizes = np.empty(capacity, dtype=np.int32)
+        self.works = np.empty(capacity, dtype=np.float64)
+        self.counts = np.empty(capacity, dtype=np.int64)
+        self.extras = []
+        self.idx = 0
+    
+    def append(self, depth, size, work, extra=None, count=1):
+        """Record one call (or count identical calls) as indexed stores"""
+        if self.idx == len(self.depths):
+            self._grow()
+        i = self.idx
+        self.depths[i] = depth
+        self.sizes[i] = size
+        self.works[i] = work
+        self.counts[i] = count
+        self.extras.append(extra)
+        self.idx = i + 1
+    
+    def extend(self, depths, sizes, works, extras):
+        """Record a batch of calls given as equal-length columns"""
+        end = self.idx + len(extras)
+        while end > len(self.depths):
+            self._grow()
+        self.depths[self.idx:end] = depths
+        self.sizes[self.idx:end] = sizes
+        self.works[self.idx:end] = works
+        self.counts[self.idx:end] = 1
+        self.extras.extend(extras)
+        self.idx = end
+    
+    def _grow(self):
+        capacity = 2 * max(len(self.depths), 1)
+        for name in ('depths', 'sizes', 'works', 'counts'):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.idx] = column[:self.idx]
+            setattr(self, name, grown)
+    
+    def __len__(self):
+        return self.idx
+    
+    def work_by_depth(self):
+        """Total work at each depth, indexed by depth"""
+        work = self.works[:self.idx] * self.counts[:self.idx]
+        return np.bincount(self.depths[:self.idx], weights=work)
+    
+    def calls_by_depth(self):
+        """Number of recorded calls at each depth, indexed by depth"""
+        return np.bincount(self.depths[:self.idx], weights=self.counts[:self.idx]).astype(np.int64)
+
 # ============================================================================
 # CASE 1 ALGORITHMS: Subproblems Dominate (Bottom-Heavy)
 # ============================================================================
 
+def halving_levels(start, end):
+    """
+    Yield the (starts, ends) arrays of the ranges on each level of the
+    recursion that halves [start, end) at mid = (start + end) // 2
+    """
+    starts = np.array([start])
+    ends = np.array([end])
+    while starts.size:
+        yield starts, ends
+        split = ends - starts > 1
+        starts, ends = starts[split], ends[split]
+        mids = (starts + ends) // 2
+        # Left child then right child, so each level stays in order
+        starts = np.column_stack((starts, mids)).ravel()
+        ends = np.column_stack((mids, ends)).ravel()
+
+def trace_halving_tree(arr, start, end, depth, trace, combine, operation):
+    """
+    Record the calls of a halving recursion over arr[start:end] whose nodes
+    combine their halves with the ufunc `combine`, one level at a time.
+    Every internal node records its `operation` and its result, every leaf
+    just its result, each with constant work. Returns the root's result.
+    """
+    values = np.asarray(arr)
+    # reduceat needs every boundary, including end == len(arr), to be an index
+    padded = np.append(values, values[:1])
+    
+    root = None
+    for level, (starts, ends) in enumerate(halving_levels(start, end)):
+        sizes = ends - starts
+        results = combine.reduceat(padded, np.column_stack((starts, ends)).ravel())[::2].tolist()
+        if root is None:
+            root = results[0]
+        
+        split_sizes = sizes[sizes > 1]
+        rows = len(split_sizes) + len(sizes)
+        trace.extend(
+            np.full(rows, depth + level),
+            np.concatenate((split_sizes, sizes)),
+            np.ones(rows, dtype=np.int64),
+            [{'operation': operation} for _ in range(len(split_sizes))]
+            + [{'result': result} for result in results]
+        )
+    
+    return root
+
 def binary_tree_sum(arr, start=0, end=None, depth=0, trace=None):
     """
     Case 1 Example: Sum all elements in array using binary tree recursion
     T(n) = 2T(n/2) + O(1)
     Just splits and combines - minimal work at each node
+    
+    The calls are traced level by level and each level's partial sums come
+    from one NumPy reduction, instead of one Python call per node.
     """
-    if trace is None:
-        trace = []
     if end is None:
         end = len(arr)
+    if trace is None:
+        trace = TraceBuf(3 * max(end - start, 1))
     
-    size = end - start
-    
-    if size <= 1:
-        result = arr[start] if size == 1 else 0
-        trace.append({'depth': depth, 'size': size, 'work': 1, 'result': result})
-        return result, trace
-    
-    mid = (start + end) // 2
-    
-    # Record the split (constant work)
-    trace.append({'depth': depth, 'size': size, 'work': 1, 'operation': 'split'})
-    
-    # Recursive calls
-    left_sum, _ = binary_tree_sum(arr, start, mid, depth + 1, trace)
-    right_sum, _ = binary_tree_sum(arr, mid, end, depth + 1, trace)
-    
-    # Combine (constant work)
-    result = left_sum + right_sum
-    trace.append({'depth': depth, 'size': size, 'work': 1, 'result': result})
+    if end - start <= 0:
+        trace.append(depth, 0, 1, {'result': 0})
+        return 0, trace
     
+    result = trace_halving_tree(arr, start, end, depth, trace, np.add, 'split')
     return result, trace
 
 def tournament_max(arr, start=0, end=None, depth=0, trace=None):
@@ -96,81 +214,87 @@ def tournament_max(arr, start=0, end=None, depth=0, trace=None):
     Case 1 Example: Find maximum using tournament style
     T(n) = 2T(n/2) + O(1)
     """
-    if trace is None:
-        trace = []
     if end is None:
         end = len(arr)
+    if trace is None:
+        trace = TraceBuf(3 * max(end - start, 1))
     
-    size = end - start
-    
-    if size <= 1:
-        result = arr[start] if size == 1 else float('-inf')
-        trace.append({'depth': depth, 'size': size, 'work': 1, 'result': result})
-        return result, trace
-    
-    mid = (start + end) // 2
-    
-    trace.append({'depth': depth, 'size': size, 'work': 1, 'operation': 'compare'})
-    
-    left_max, _ = tournament_max(arr, start, mid, depth + 1, trace)
-    right_max, _ = tournament_max(arr, mid, end, depth + 1, trace)
-    
-    result = max(left_max, right_max)
-    trace.append({'depth': depth, 'size': size, 'work': 1, 'result': result})
+    if end - start <= 0:
+        trace.append(depth, 0, 1, {'result': float('-inf')})
+        return float('-inf'), trace
     
+    result = trace_halving_tree(arr, start, end, depth, trace, np.maximum, 'compare')
     return result, trace
 
 # ============================================================================
 # CASE 2 ALGORITHMS: Balanced Work (Equal at All Levels)
 # ============================================================================
 
-def merge_sort_real(arr, depth=0, trace=None):
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def merge_runs(src, tgt, start, mid, end):
+        """
+        Merge the sorted runs src[start:mid] and src[mid:end] into tgt[start:end]
+        """
+        i = start
+        j = mid
+        for k in range(start, end):
+            if i < mid and (j >= end or src[i] <= src[j]):
+                tgt[k] = src[i]
+                i += 1
+            else:
+                tgt[k] = src[j]
+                j += 1
+else:
+    # Without numba the element loop would run in the interpreter, so
+    # let NumPy's stable sort (a C merge) combine the two runs instead
+    def merge_runs(src, tgt, start, mid, end):
+        tgt[start:end] = np.sort(src[start:end], kind='stable')
+
+def merge_sort_real(arr, depth=0, trace=None, collect_trace=True):
     """
     Case 2 Example: Classic Merge Sort
     T(n) = 2T(n/2) + O(n)
     Linear work at each level for merging
+    
+    With collect_trace=False there is no tree to show, so NumPy sorts the
+    values directly and trace is None.
     """
+    if not collect_trace:
+        return np.sort(np.array(arr), kind='stable').tolist(), None
     if trace is None:
-        trace = []
+        trace = TraceBuf(3 * max(len(arr), 1))
     
-    n = len(arr)
-    
-    if n <= 1:
-        trace.append({'depth': depth, 'size': n, 'work': n, 'operation': 'base'})
-        return arr, trace
-    
-    mid = n // 2
-    left = arr[:mid]
-    right = arr[mid:]
+    # The recursion only drives the split and records the trace; the values
+    # live in one shared buffer and every merge runs in the compiled kernel
+    data = np.array(arr)
+    scratch = np.empty_like(data)
     
-    # Record split
-    trace.append({'depth': depth, 'size': n, 'work': n, 'operation': 'split'})
-    
-    # Recursive calls
-    left_sorted, _ = merge_sort_real(left, depth + 1, trace)
-    right_sorted, _ = merge_sort_real(right, depth + 1, trace)
-    
-    # Merge (linear work)
-    merged = []
-    i = j = 0
-    work_done = 0
-    
-    while i < len(left_sorted) and j < len(right_sorted):
-        if left_sorted[i] <= right_sorted[j]:
-            merged.append(left_sorted[i])
-            i += 1
-        else:
-            merged.append(right_sorted[j])
-            j += 1
-        work_done += 1
-    
-    merged.extend(left_sorted[i:])
-    merged.extend(right_sorted[j:])
-    work_done += len(left_sorted[i:]) + len(right_sorted[j:])
+    def sort_range(start, end, depth):
+        n = end - start
+        
+        if n <= 1:
+            trace.append(depth, n, n, {'operation': 'base'})
+            return
+        
+        mid = start + n // 2
+        
+        # Record split
+        trace.append(depth, n, n, {'operation': 'split'})
+        
+        # Recursive calls
+        sort_range(start, mid, depth + 1)
+        sort_range(mid, end, depth + 1)
+        
+        # Merge (linear work: every element is written once)
+        scratch[start:end] = data[start:end]
+        merge_runs(scratch, data, start, mid, end)
+        
+        trace.append(depth, n, n, {'operation': 'merge'})
     
-    trace.append({'depth': depth, 'size': n, 'work': work_done, 'operation': 'merge'})
+    sort_range(0, len(data), depth)
     
-    return merged, trace
+    return data.tolist(), trace
 
 def partition_statistics(arr, depth=0, trace=None):
     """
@@ -178,25 +302,29 @@ def partition_statistics(arr, depth=0, trace=None):
     T(n) = 2T(n/2) + O(n)
     """
     if trace is None:
-        trace = []
+        trace = TraceBuf(2 * max(len(arr), 1))
     
+    # Coerce once; the halves passed down below are already float arrays
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
     n = len(arr)
     
     if n <= 1:
-        trace.append({'depth': depth, 'size': n, 'work': 1, 'operation': 'base'})
+        trace.append(depth, n, 1, {'operation': 'base'})
         return arr, trace
     
-    # Linear scan to compute statistics
-    median = np.median(arr)
-    mean = np.mean(arr)
+    # Linear scan to compute statistics: one partition pass places the
+    # middle element(s) for the median and leaves the array split around it
+    k = n // 2
+    part = np.partition(arr, (k - 1, k))
+    median = part[k] if n % 2 else 0.5 * (part[k - 1] + part[k])
+    mean = arr.sum() / n
     work = n  # Linear scan
     
-    trace.append({'depth': depth, 'size': n, 'work': work, 
-                 'operation': f'stats: median={median:.1f}, mean={mean:.1f}'})
+    trace.append(depth, n, work, {'operation': 'stats', 'median': median, 'mean': mean})
     
-    # Partition around median
-    left = [x for x in arr if x < median]
-    right = [x for x in arr if x >= median]
+    # Partition around median: the partition pass already did the split
+    left = part[:k]
+    right = part[k:]
     
     # Process both halves if they exist
     if len(left) > 0:
@@ -210,109 +338,189 @@ def partition_statistics(arr, depth=0, trace=None):
 # CASE 3 ALGORITHMS: Outside Work Dominates (Top-Heavy)
 # ============================================================================
 
-def matrix_recursive_multiply(n, depth=0, trace=None):
+def matrix_recursive_multiply(n, a=2, combine_exp=3, depth=0, trace=None):
     """
     Case 3 Example: Naive recursive matrix multiplication
     T(n) = 2T(n/2) + O(n³) 
     Combining submatrices requires n³ work
+    
+    a and combine_exp give the general model T(n) = a*T(n/2) + O(n^combine_exp):
+    the default is the Case 3 model above, a=8, combine_exp=2 is the standard
+    block recursion and a=7, combine_exp=2 is Strassen (both Case 1).
+    
+    Every call on a level has the same size, so each distinct size is worked
+    out once and its level is recorded as a single row counting its calls.
     """
     if trace is None:
-        trace = []
-    
-    if n <= 1:
-        trace.append({'depth': depth, 'size': n, 'work': 1, 'operation': 'base'})
-        return 1, trace
+        trace = TraceBuf(max(n, 1).bit_length() + 1)
     
-    # Simulate n³ work for matrix operations at this level
-    work = n ** 3
-    trace.append({'depth': depth, 'size': n, 'work': work, 
-                 'operation': f'matrix ops: {n}×{n}×{n}'})
+    size, calls = n, 1
+    while size > 1:
+        # Simulate n^combine_exp work for matrix operations at this level
+        trace.append(depth, size, size ** combine_exp, {'operation': 'matrix ops'}, count=calls)
+        
+        # a recursive calls on n/2 sized problems
+        size //= 2
+        calls *= a
+        depth += 1
     
-    # Two recursive calls on n/2 sized problems
-    matrix_recursive_multiply(n // 2, depth + 1, trace)
-    matrix_recursive_multiply(n // 2, depth + 1, trace)
+    trace.append(depth, size, 1, {'operation': 'base'}, count=calls)
     
-    return work, trace
+    return (n ** combine_exp if n > 1 else 1), trace
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def find_pair(arr, start, end, target):
+        """
+        Scan the pairs i < j of arr[start:end] in row-major order for one that
+        sums to target; returns (i, j, pairs checked), with i = j = -1 if none does
+        """
+        work = 0
+        for i in range(start, end):
+            for j in range(i + 1, end):
+                work += 1
+                if arr[i] + arr[j] == target:
+                    return i, j, work
+        return -1, -1, work
+else:
+    # Without numba the loops would run in the interpreter, so check
+    # every pair in one NumPy expression instead
+    def find_pair(arr, start, end, target):
+        rows, cols = np.triu_indices(end - start, 1)
+        rows += start
+        cols += start
+        hits = np.flatnonzero(arr[rows] + arr[cols] == target)
+        if hits.size:
+            first = hits[0]
+            return int(rows[first]), int(cols[first]), int(first) + 1
+        return -1, -1, rows.size
 
-def exhaustive_search_with_pruning(arr, target, depth=0, trace=None):
+def has_pair_with_sum(values, target):
+    """
+    Two-sum in one pass with a hash set: does any pair i < j of values sum to target?
+    """
+    seen = set()
+    for x in values:
+        if target - x in seen:
+            return True
+        seen.add(x)
+    return False
+
+def exhaustive_search_with_pruning(arr, target, start=0, end=None, depth=0, trace=None):
     """
     Case 3 Example: Exhaustive search with expensive local computation
     T(n) = 2T(n/2) + O(n²)
     Quadratic work at each node for checking combinations
     """
+    # Convert once; every call works on the range [start, end) of this array
+    arr = np.asarray(arr)
+    if end is None:
+        end = len(arr)
     if trace is None:
-        trace = []
+        trace = TraceBuf(2 * max(end - start, 1))
     
-    n = len(arr)
+    n = end - start
     
     if n <= 1:
-        trace.append({'depth': depth, 'size': n, 'work': 1, 'operation': 'base'})
-        return arr[0] == target if n == 1 else False, trace
-    
-    # Check all pairs at this level (quadratic work)
-    work = 0
-    for i in range(n):
-        for j in range(i + 1, n):
-            work += 1
-            if arr[i] + arr[j] == target:
-                trace.append({'depth': depth, 'size': n, 'work': work, 
-                            'operation': f'found pair: {arr[i]}+{arr[j]}={target}'})
-                return True, trace
-    
-    trace.append({'depth': depth, 'size': n, 'work': work, 
-                 'operation': f'checked {work} pairs'})
+        trace.append(depth, n, 1, {'operation': 'base'})
+        return bool(arr[start] == target) if n == 1 else False, trace
+    
+    # Check all pairs at this level (quadratic work). The linear two-sum
+    # pass settles whether any pair matches; the pair scan only runs to
+    # locate the hit, and so count the pairs checked before it
+    i, j, work = -1, -1, n * (n - 1) // 2
+    if has_pair_with_sum(arr[start:end].tolist(), target):
+        i, j, work = find_pair(arr, start, end, target)
+    if i >= 0:
+        trace.append(depth, n, work, {'operation': 'found pair', 'pair': (arr[i].item(), arr[j].item())})
+        return True, trace
+    
+    trace.append(depth, n, work, {'operation': 'checked pairs'})
     
     # Recursively check halves
-    mid = n // 2
-    left_found, _ = exhaustive_search_with_pruning(arr[:mid], target, depth + 1, trace)
+    mid = start + n // 2
+    left_found = exhaustive_search_with_pruning(arr, target, start, mid, depth + 1, trace)[0]
     if left_found:
         return True, trace
     
-    right_found, _ = exhaustive_search_with_pruning(arr[mid:], target, depth + 1, trace)
+    right_found = exhaustive_search_with_pruning(arr, target, mid, end, depth + 1, trace)[0]
     return right_found, trace
 
 # ============================================================================
 # VISUALIZATION FUNCTIONS
 # ============================================================================
 
+# A 30-wide bar with k filled cells is the 30-character window of this
+# track starting at 30 - k
+BAR_TRACK = "█" * 30 + "░" * 30
+
+def aggregate_trace(trace):
+    """
+    Per-depth totals of a trace as (depths, calls, work) arrays, one entry
+    for each depth that has calls, from one bincount over each column
+    """
+    calls = trace.calls_by_depth()
+    depths = np.flatnonzero(calls)
+    return depths, calls[depths], trace.work_by_depth()[depths]
+
+# Algorithms whose calls and work per depth depend only on the input size,
+# not on its values (their traces' extras do depend on the values)
+SIZE_ONLY_PROFILES = (binary_tree_sum, tournament_max, merge_sort_real, matrix_recursive_multiply)
+
+@lru_cache(maxsize=32)
+def _size_profile(algorithm, n):
+    """aggregate_trace of one run on n reverse-sorted elements (or on n itself for the matrix model)"""
+    data = n if algorithm == matrix_recursive_multiply else list(range(n, 0, -1))
+    profile = aggregate_trace(algorithm(data)[1])
+    for column in profile:
+        column.setflags(write=False)  # shared by every caller of the cache
+    return profile
+
+def depth_profile(algorithm, data, *args):
+    """
+    (depths, calls, work) per depth of algorithm run on data, shared between
+    runs of the same size for the algorithms in SIZE_ONLY_PROFILES
+    """
+    if args or algorithm not in SIZE_ONLY_PROFILES:
+        return aggregate_trace(algorithm(data, *args)[1])
+    return _size_profile(algorithm, data if isinstance(data, int) else len(data))
+
+@singledispatch
+def preview_data(data):
+    """(preview text, size) describing an algorithm's input for the report"""
+    try:
+        n = len(data)
+    except TypeError:
+        n = "?"
+    return repr(data), n
+
+@preview_data.register
+def _(data: int):
+    return f"n={data}", data
+
+@preview_data.register(list)
+@preview_data.register(tuple)
+@preview_data.register(np.ndarray)
+@preview_data.register(str)
+def _(data):
+    n = len(data)
+    return f"{list(data[:10])}{'...' if n > 10 else ''}", n
+
 def analyze_algorithm_characteristics(name, algorithm, data, *args):
     """
     Analyze and visualize the characteristics of an algorithm
     """
     print_separator("=", title=f"{name}")
     
-    # Run algorithm and collect trace
-    if args:
-        result, trace = algorithm(data, *args)
-    else:
-        result, trace = algorithm(data)
-    
-    # Analyze work distribution by depth
-    depth_work = {}
-    for item in trace:
-        if 'depth' in item:
-            depth = item['depth']
-            if depth not in depth_work:
-                depth_work[depth] = {'count': 0, 'total_work': 0, 'operations': []}
-            depth_work[depth]['count'] += 1
-            depth_work[depth]['total_work'] += item.get('work', 0)
-            if 'operation' in item:
-                depth_work[depth]['operations'].append(item['operation'])
+    # Run algorithm and analyze work distribution by depth
+    depths, counts, works = depth_profile(algorithm, data, *args)
+    depth_work = {
+        depth: {'count': count, 'total_work': work}
+        for depth, count, work in zip(depths.tolist(), counts.tolist(), works.tolist())
+    }
     
     # --- FIXED: handle ints vs sequences here ---
-    if isinstance(data, int):
-        data_preview = f"n={data}"
-        n = data
-    elif isinstance(data, (list, tuple, np.ndarray, str)):
-        seq = list(data)
-        data_preview = f"{seq[:10]}{'...' if len(seq) > 10 else ''}"
-        n = len(seq)
-    else:
-        try:
-            n = len(data)
-        except TypeError:
-            n = "?"
-        data_preview = repr(data)
+    data_preview, n = preview_data(data)
 
     print(f"\nData: {data_preview}")
     print(f"Size: n = {n}")
@@ -332,7 +540,7 @@ def analyze_algorithm_characteristics(name, algorithm, data, *args):
         total_work += info['total_work']
         
         bar_width = int(30 * (info['total_work'] / max_work)) if max_work > 0 else 0
-        bar = "█" * bar_width + "░" * (30 - bar_width)
+        bar = BAR_TRACK[30 - bar_width:60 - bar_width]
         
         print(f"{depth:5} | {info['count']:5} | {info['total_work']:10.0f} | {work_per_node:9.1f} | {bar}")
     
@@ -341,15 +549,28 @@ def analyze_algorithm_characteristics(name, algorithm, data, *args):
     
     return depth_work, total_work
 
+# Bar colors cycle through this table by depth
+LEVEL_COLORS = np.array(['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD'])
+
+def depth_work_profile(algorithm, data_size):
+    """
+    (depths, work per depth, cumulative work) of one run of algorithm on
+    data_size elements (or on n = data_size for the matrix model). How much
+    work lands on each level depends only on the size, not on the values or
+    their order, so repeat runs with the same size reuse the first result.
+    """
+    depths, _, work_values = depth_profile(algorithm, data_size)
+    return depths, work_values, np.cumsum(work_values)
+
 def visualize_master_cases(data_size=32):
     """
     Create comprehensive visualization comparing all three cases
     """
-    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+    # matplotlib is only needed for this plot, so the text-only options
+    # don't pay for importing it
+    import matplotlib.pyplot as plt
     
-    # Generate test data
-    data = list(range(data_size, 0, -1))  # Reverse sorted
-    random.shuffle(data)
+    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
     
     algorithms = [
         ("CASE 1: Binary Tree Sum\nT(n) = 2T(n/2) + O(1)", binary_tree_sum),
@@ -359,28 +580,12 @@ def visualize_master_cases(data_size=32):
     
     # For each case, create visualizations
     for col, (title, algorithm) in enumerate(algorithms):
-        # Run algorithm
-        if algorithm == matrix_recursive_multiply:
-            result, trace = algorithm(data_size)
-        else:
-            result, trace = algorithm(data[:data_size])
-        
-        # Analyze work by depth
-        depth_work = {}
-        for item in trace:
-            if 'depth' in item:
-                depth = item['depth']
-                if depth not in depth_work:
-                    depth_work[depth] = 0
-                depth_work[depth] += item.get('work', 0)
-        
-        depths = sorted(depth_work.keys())
-        work_values = [depth_work[d] for d in depths]
+        # Run algorithm and analyze work by depth
+        depths, work_values, cumulative_work = depth_work_profile(algorithm, data_size)
         
         # Top plot: Work distribution
         ax1 = axes[0, col]
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD']
-        bars = ax1.bar(depths, work_values, color=[colors[i % len(colors)] for i in depths])
+        bars = ax1.bar(depths, work_values, color=LEVEL_COLORS[depths % len(LEVEL_COLORS)])
         
         # Add value labels on bars
         for bar, work in zip(bars, work_values):
@@ -395,7 +600,6 @@ def visualize_master_cases(data_size=32):
         
         # Bottom plot: Cumulative work
         ax2 = axes[1, col]
-        cumulative_work = np.cumsum(work_values)
         ax2.plot(depths, cumulative_work, 'o-', linewidth=2, markersize=8)
         ax2.fill_between(depths, 0, cumulative_work, alpha=0.3)
         
@@ -539,7 +743,7 @@ def interactive_case_explorer():
             print("\n💡 Notice: Simple comparisons only, tree structure does most work")
             
         elif choice == '3':
-            sorted_data = merge_sort_real(data.copy())[0]
+            sorted_data = merge_sort_real(data, collect_trace=False)[0]
             analyze_algorithm_characteristics("Merge Sort", merge_sort_real, data)
             print("\n💡 Notice: Work is proportional to n at each level, perfectly balanced")
             print(f"✅ Sorted result: {sorted_data[:10]}{'...' if len(sorted_data) > 10 else ''}")
@@ -562,7 +766,7 @@ def interactive_case_explorer():
             size = int(input("Enter data size for comparison (e.g., 32): "))
             visualize_master_cases(size)
             
-        input("\n[Press Enter to continue...]")
+        pause("\n[Press Enter to continue...]")
 
 def main():
     """
@@ -574,21 +778,21 @@ def main():
     
     # 1. Show characteristics
     demonstrate_case_characteristics()
-    input("\n[Press Enter to continue to examples...]")
+    pause("\n[Press Enter to continue to examples...]")
     
     # 2. Run examples for each case
     print_separator("=", title="CASE 1 EXAMPLE: BINARY TREE SUM")
     data = list(range(16, 0, -1))
     analyze_algorithm_characteristics("Binary Tree Sum (Case 1)", binary_tree_sum, data)
-    input("\n[Press Enter to continue...]")
+    pause("\n[Press Enter to continue...]")
     
     print_separator("=", title="CASE 2 EXAMPLE: MERGE SORT")
     analyze_algorithm_characteristics("Merge Sort (Case 2)", merge_sort_real, data)
-    input("\n[Press Enter to continue...]")
+    pause("\n[Press Enter to continue...]")
     
     print_separator("=", title="CASE 3 EXAMPLE: MATRIX OPERATIONS")
     analyze_algorithm_characteristics("Matrix Multiply (Case 3)", matrix_recursive_multiply, 16)
-    input("\n[Press Enter to see visual comparison...]")
+    pause("\n[Press Enter to see visual comparison...]")
     
     # 3. Visual comparison
     visualize_master_cases(32)
@@ -596,7 +800,7 @@ def main():
     # 4. Interactive exploration
     print("\n" + "="*70)
     print("Would you like to explore more algorithms interactively? (y/n)")
-    if input().lower() == 'y':
+    if pause().lower() == 'y':
         interactive_case_explorer()
     
     print("\n" + "="*70)
@@ -1,9 +1,29 @@
 import math
+import numpy as np
 
-def master_method_analyzer(a, b, f_n, n, f_description="f(n)"):
+def classify_ratio(ratio):
+    """
+    Master Method case (1, 2 or 3) for f(n)/n^(log_b(a)), simplified for
+    demonstration: below 0.5 is Case 1, 0.5 through 2 is Case 2, above 2 is
+    Case 3. Works elementwise on arrays of ratios.
+    """
+    ratio = np.asarray(ratio)
+    return 1 + (ratio >= 0.5).astype(int) + (ratio > 2).astype(int)
+
+def master_method_batch(a, b, f_values, n_test=1000):
+    """
+    Classify many recurrences T(n) = a*T(n/b) + f(n) at once from their
+    f(n_test) values; a, b and f_values are broadcast against each other,
+    so a grid of (a, b) pairs takes one call
+    """
+    log_b_a = np.log(a) / np.log(b)
+    return classify_ratio(np.asarray(f_values, dtype=float) / np.power(float(n_test), log_b_a))
+
+def master_method_analyzer(a, b, f_n, n, f_description="f(n)", case=None):
     """
     Analyzes recurrence using Master Method
     T(n) = a*T(n/b) + f(n)
+    Pass case when it is already known, e.g. from master_method_batch.
     """
     print(f"\n{'='*60}")
     print(f"Master Method Analysis")
@@ -33,13 +53,15 @@ def master_method_analyzer(a, b, f_n, n, f_description="f(n)"):
     print(f"Ratio f(n)/n^(log_b(a)) = {ratio:.6f}")
     
     # Determine case
-    if ratio < 0.5:  # Simplified check for demonstration
+    if case is None:
+        case = classify_ratio(ratio)
+    if case == 1:
         print("\n**CASE 1: Subproblems dominate**")
         print("f(n) is polynomially smaller than n^(log_b(a))")
         print("The work is concentrated in the leaves of recursion tree")
         print(f"Solution: T(n) = Θ(n^{log_b_a:.3f})")
         return 1, log_b_a
-    elif 0.5 <= ratio <= 2:  # Simplified check
+    elif case == 2:
         print("\n**CASE 2: Balanced (tie)**")
         print("f(n) and n^(log_b(a)) are the same order")
         print("Work is evenly distributed across all levels")
@@ -53,25 +75,32 @@ def master_method_analyzer(a, b, f_n, n, f_description="f(n)"):
         return 3, None
 
 # Demonstrate all three cases
+DEMO_EXAMPLES = [
+    # (title, a, b, f(n), f(n) as text, interpretation)
+    ("Binary Search Tree Operations", 2, 2, lambda x: 1, "1",
+     "Most work happens in recursive calls (searching subtrees)"),    # Case 1
+    ("Merge Sort", 2, 2, lambda x: x, "n",
+     "Work at each level (merging) equals recursive work"),           # Case 2
+    ("Sloppy Recursive Algorithm", 2, 2, lambda x: x**2, "n²",
+     "The n² work at each call dominates the recursion"),             # Case 3
+]
+
 print("\n" + "="*70)
 print("MASTER METHOD: THREE CASES DEMONSTRATION")
 print("="*70)
 
-# CASE 1: Subproblems dominate
-print("\n--- Example 1: Binary Search Tree Operations ---")
-master_method_analyzer(2, 2, lambda x: 1, 1000, "1")
-print("\nInterpretation: Most work happens in recursive calls (searching subtrees)")
+# One batched classification covers every example
+demo_cases = master_method_batch([ex[1] for ex in DEMO_EXAMPLES],
+                                 [ex[2] for ex in DEMO_EXAMPLES],
+                                 [ex[3](1000) for ex in DEMO_EXAMPLES])
+for i, ((title, a, b, f_n, f_description, interpretation), case) in enumerate(
+        zip(DEMO_EXAMPLES, demo_cases), start=1):
+    print(f"\n--- Example {i}: {title} ---")
+    master_method_analyzer(a, b, f_n, 1000, f_description, case=case)
+    print(f"\nInterpretation: {interpretation}")
 
-# CASE 2: Tie
-print("\n--- Example 2: Merge Sort ---")
-master_method_analyzer(2, 2, lambda x: x, 1000, "n")
-print("\nInterpretation: Work at each level (merging) equals recursive work")
-
-# CASE 3: Outside work dominates
-print("\n--- Example 3: Sloppy Recursive Algorithm ---")
-master_method_analyzer(2, 2, lambda x: x**2, 1000, "n²")
-print("\nInterpretation: The n² work at each call dominates the recursion")
 
+FULL_BAR = "█" * 20  # level bars are prefixes of this
 
 def master_method_demo():
     """
@@ -91,26 +120,30 @@ def master_method_demo():
         print("\nLevel | Size | # Nodes | f(size) | Level Work")
         print("-" * 55)
         
-        total_work = 0
-        level_works = []
+        # Every level at once: a^i nodes of size n/b^i
+        level_ids = np.arange(levels)
+        sizes = n / np.power(float(b), level_ids)
+        # Node counts stay Python ints: a^i outgrows int64 on deep trees
+        num_nodes = np.power(a, level_ids.astype(object))
+        f_values = np.where(sizes >= 1, np.broadcast_to(f_func(sizes), sizes.shape), 0)
+        level_works = (num_nodes * f_values).astype(float)
+        total_work = level_works.sum()
+        
+        # Bars are scaled to the largest level so far (at least 1)
+        max_work = np.maximum.accumulate(np.maximum(level_works, 1))
+        bar_widths = (20 * level_works / max_work).astype(int)
         
-        for level in range(levels):
-            size = n / (b ** level)
-            num_nodes = a ** level
-            f_value = f_func(size) if size >= 1 else 0
-            level_work = num_nodes * f_value
-            level_works.append(level_work)
-            total_work += level_work
-            
-            bar = "█" * int(20 * level_work / max(level_works + [1]))
-            print(f"{level:5} | {size:4.0f} | {num_nodes:7} | {f_value:7.1f} | {level_work:10.1f} {bar}")
+        for level, size, nodes, f_value, level_work, width in zip(
+                level_ids.tolist(), sizes.tolist(), num_nodes.tolist(), f_values.tolist(),
+                level_works.tolist(), bar_widths.tolist()):
+            print(f"{level:5} | {size:4.0f} | {nodes:7} | {f_value:7.1f} | {level_work:10.1f} {FULL_BAR[:width]}")
         
         print("-" * 55)
         print(f"Total: {total_work:.1f}")
         
         # Determine dominant portion
-        leaf_work = level_works[-1] if level_works else 0
-        root_work = level_works[0] if level_works else 0
+        leaf_work = level_works[-1] if level_works.size else 0
+        root_work = level_works[0] if level_works.size else 0
         
         if leaf_work > 0.5 * total_work:
             print("➜ CASE 1: Leaves dominate (bottom-heavy)")
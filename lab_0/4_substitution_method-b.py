@@ -2,7 +2,7 @@
 # pip install dash plotly numpy
 
 """_summary_
-	•	T(n) actual (solid line) = the exact value of the recurrence you picked, computed recursively with our chosen base case (e.g., T(1)=1) and halving rule (n//2). It’s a mathematical simulation of the recurrence, not wall-clock timing of code.
+	•	T(n) actual (solid line) = the exact value of the recurrence you picked, unrolled level by level from our chosen base case (e.g., T(1)=1) and halving rule (n//2). It’s a mathematical simulation of the recurrence, not wall-clock timing of code.
 	•	c·g(n) (dashed line) = the candidate upper bound you’d try to prove by substitution (e.g., g(n)=n\log n,\; n^2,\; n(\log n)^2), scaled by the slider c.
 
 So you’re comparing the recurrence’s exact values vs a theoretical bound you’re testing. Red markers simply show n where, with your current c, the inequality T(n) \le c\cdot g(n) doesn’t hold for the plotted n. (That doesn’t refute big-O; it may just mean you need a larger c or larger n before it kicks in.)
@@ -14,61 +14,44 @@ The “Work by level” tab is also analytic: it plots the recursion-tree outsid
 import math
 from functools import lru_cache
 import numpy as np
-from typing import List, Tuple
 
 import plotly.graph_objects as go
-from dash import Dash, dcc, html, Input, Output
+from dash import Dash, dcc, html, Input, Output, Patch, ctx
 
 # ----------------------------
 # Recurrences & helper math
 # ----------------------------
 
-@lru_cache(None)
-def T_2Tn2_plus_n(n: int) -> float:
-    if n <= 1:
-        return 1.0
-    return 2.0 * T_2Tn2_plus_n(n // 2) + float(n)
-
-@lru_cache(None)
-def T_Tn2_plus_n2(n: int) -> float:
-    if n <= 1:
-        return 1.0
-    return T_Tn2_plus_n2(n // 2) + float(n) * float(n)
-
-@lru_cache(None)
-def T_2Tn2_plus_nlogn(n: int) -> float:
-    if n <= 1:
-        return 1.0
-    return 2.0 * T_2Tn2_plus_nlogn(n // 2) + float(n) * math.log2(max(n, 2))
-
-# Closed form to avoid deep recursion
-def T_linear(n: int) -> float:
-    return float(max(n, 1))
-
-def g_nlogn(n: int) -> float:
-    if n <= 1:
-        return 1.0
-    return float(n) * math.log2(n)
-
-def g_n2(n: int) -> float:
-    return float(n) * float(n)
-
-def g_nlog2(n: int) -> float:
-    if n <= 1:
-        return 1.0
-    ln = math.log2(n)
-    return float(n) * (ln * ln)
-
-def g_n(n: int) -> float:
-    return float(n)
+def T_2Tn2_plus_nlogn_pow2(k: int) -> np.ndarray:
+    # T(2^i) for i = 0..k; log2(2^i) = i, so this is integer arithmetic only
+    T = np.empty(k + 1, dtype=float)
+    t = 1
+    T[0] = t
+    for i in range(1, k + 1):
+        t = 2 * t + (1 << i) * i
+        T[i] = t
+    return T
+
+# T(n) = T(n-1) + 1 in closed form, over the whole domain at once
+def T_linear_vec(xs: np.ndarray) -> np.ndarray:
+    return np.maximum(xs, 1).astype(float)
+
+# Candidate bounds g(n), evaluated over a whole float array at once
+# (x is the float domain, lg its log2_domain table)
+G_VEC = {
+    "nlogn": lambda x, lg: x * lg,
+    "n2": lambda x, lg: x * x,
+    "nlog2": lambda x, lg: x * lg ** 2,
+    "n": lambda x, lg: x.astype(float),
+}
 
-def powers_of_two_up_to(exp_k: int) -> List[int]:
-    return [2 ** i for i in range(1, exp_k + 1)]
+def powers_of_two_up_to(exp_k: int) -> np.ndarray:
+    return np.left_shift(1, np.arange(1, exp_k + 1, dtype=np.int64))
 
 # Registry (plain Unicode; no TeX macros)
 RECURRENCES = {
     "2T(n/2) + n   (guess: n log n)": {
-        "T": T_2Tn2_plus_n, "g": g_nlogn,
+        "g_key": "nlogn",
         "suggested_c": 2.0, "dc": True,
         "proof": [
             "Example: T(n) = 2T(n/2) + n",
@@ -77,10 +60,11 @@ RECURRENCES = {
             "= c·n·(log₂ n − 1) + n = c·n·log₂ n − (c−1)·n",
             "Holds if c ≥ 1."
         ],
-        "f_local": lambda n: float(n), "a": 2, "b": 2
+        "f_local": lambda n: float(n), "a": 2, "b": 2,
+        "f_vec": lambda s: s.astype(float)
     },
     "T(n/2) + n^2  (guess: n^2)": {
-        "T": T_Tn2_plus_n2, "g": g_n2,
+        "g_key": "n2",
         "suggested_c": 1.5, "dc": True,
         "proof": [
             "Example: T(n) = T(n/2) + n²",
@@ -88,20 +72,22 @@ RECURRENCES = {
             "Substitute: c·(n/2)² + n² = (c/4)·n² + n²",
             "≤ c·n² when c ≥ 4/3."
         ],
-        "f_local": lambda n: float(n) * float(n), "a": 1, "b": 2
+        "f_local": lambda n: float(n) * float(n), "a": 1, "b": 2,
+        "f_vec": lambda s: s.astype(float) ** 2
     },
     "2T(n/2) + n log n  (guess: n log^2 n)": {
-        "T": T_2Tn2_plus_nlogn, "g": g_nlog2,
+        "T_pow2": T_2Tn2_plus_nlogn_pow2, "g_key": "nlog2",
         "suggested_c": 1.0, "dc": True,
         "proof": [
             "Example: T(n) = 2T(n/2) + n·log₂ n",
             "Guess with n·log₂ n fails; try T(n) ≤ c·n·(log₂ n)².",
             "Substitution validates for suitable c."
         ],
-        "f_local": lambda n: float(n) * math.log2(max(n, 2)), "a": 2, "b": 2
+        "f_local": lambda n: float(n) * math.log2(max(n, 2)), "a": 2, "b": 2,
+        "f_vec": lambda s: s * np.log2(np.maximum(s, 2))
     },
     "T(n-1) + 1   (guess: n)": {
-        "T": T_linear, "g": g_n,
+        "T_vec": T_linear_vec, "g_key": "n",
         "suggested_c": 1.0, "dc": False,
         "proof": [
             "Example: T(n) = T(n−1) + 1",
@@ -114,39 +100,102 @@ RECURRENCES = {
 
 def make_domain(key: str, k: int) -> np.ndarray:
     dc = RECURRENCES[key]["dc"]
-    return np.array(powers_of_two_up_to(k) if dc else list(range(1, 2 ** k + 1)), dtype=int)
+    return powers_of_two_up_to(k) if dc else np.arange(1, 2 ** k + 1, dtype=np.int64)
 
-def series(key: str, k: int, c: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    xs = make_domain(key, k)
-    Tfun = RECURRENCES[key]["T"]; gfun = RECURRENCES[key]["g"]
-    T_vals = np.array([Tfun(int(n)) for n in xs], dtype=float)
-    B_vals = c * np.array([gfun(int(n)) for n in xs], dtype=float)
-    return xs, T_vals, B_vals
+# Everything the callbacks can ask for, built once at import
+K_MIN, K_MAX = 3, 12
+PROOF_TEXT = {key: "\n".join(info["proof"]) for key, info in RECURRENCES.items()}
+DOMAIN_CACHE = {(key, k): make_domain(key, k)
+                for key in RECURRENCES for k in range(K_MIN, K_MAX + 1)}
 
+def _build_T_table_pow2(key: str, k: int) -> np.ndarray:
+    # On n = 2^i the recurrence unrolls level by level: T[i] = a*T[i-1] + f(2^i)
+    info = RECURRENCES[key]
+    if "T_pow2" in info:
+        return info["T_pow2"](k)
+    a, f_local = info["a"], info["f_local"]
+    T = np.empty(k + 1, dtype=float)
+    T[0] = 1.0
+    for i in range(1, k + 1):
+        T[i] = a * T[i - 1] + f_local(1 << i)
+    return T
+
+# T(2^i) per recurrence, indexed by i; one array each, grown only if a
+# larger k than any seen so far is requested
+T_POW2_TABLE: dict[str, np.ndarray] = {}
+
+def T_table_pow2(key: str, k: int) -> np.ndarray:
+    table = T_POW2_TABLE.get(key)
+    if table is None or table.size <= k:
+        table = _build_T_table_pow2(key, max(k, K_MAX))
+        table.setflags(write=False)
+        T_POW2_TABLE[key] = table
+    return table[:k + 1]
+
+@lru_cache(maxsize=256)
+def T_series(key: str, k: int) -> tuple[np.ndarray, np.ndarray]:
+    # Independent of c, so every c slider position reuses the same table
+    xs = DOMAIN_CACHE.get((key, k))
+    if xs is None:
+        xs = make_domain(key, k)
+    info = RECURRENCES[key]
+    if info["dc"]:
+        T_vals = T_table_pow2(key, k)[1:]  # aligned with powers_of_two_up_to(k)
+    else:
+        T_vals = info["T_vec"](xs)  # every other recurrence has a closed form
+    for column in (xs, T_vals):
+        column.setflags(write=False)  # shared by every caller of the cache
+    return xs, T_vals
+
+@lru_cache(maxsize=256)
+def log2_domain(key: str, k: int) -> np.ndarray:
+    # log2(max(n, 2)) over the domain; on powers of two that is just 1..k
+    if RECURRENCES[key]["dc"]:
+        lg = np.arange(1, k + 1, dtype=np.float64)
+    else:
+        xs, _ = T_series(key, k)
+        lg = np.log2(np.maximum(xs, 2).astype(np.float64))
+    lg.setflags(write=False)
+    return lg
+
+@lru_cache(maxsize=256)
+def g_series(key: str, k: int) -> np.ndarray:
+    # g(n) over the domain; the bound is just c times this
+    xs, _ = T_series(key, k)
+    g_vec = G_VEC[RECURRENCES[key]["g_key"]]
+    g_vals = g_vec(xs.astype(np.float64), log2_domain(key, k))
+    g_vals.setflags(write=False)
+    return g_vals
+
+MAX_BARS = 256  # more bars than this are sub-pixel in the work-by-level tab
+
+@lru_cache(maxsize=256)
 def work_by_level(key: str, k: int) -> tuple[np.ndarray, np.ndarray, str]:
     info = RECURRENCES[key]
     if not info.get("dc", False):
+        # Uniform work: MAX_BARS evenly spaced steps look the same as all 2^k
         n = 2 ** k
-        xs = np.arange(n)
-        return xs, np.ones_like(xs, dtype=float), "Linear steps: uniform work"
+        xs = np.arange(0, n, max(1, n // MAX_BARS))
+        vals = np.ones_like(xs, dtype=float)
+        for column in (xs, vals):
+            column.setflags(write=False)
+        return xs, vals, "Linear steps: uniform work"
     n = 2 ** k
-    a, b = info["a"], info["b"]
-    f_local = info["f_local"]
-    vals = []
-    size = float(n); i = 0
-    while size >= 1.0:
-        nodes = a ** i
-        vals.append(nodes * f_local(max(int(size), 1)))
-        i += 1
-        size = size / b
-    xs = np.arange(len(vals))
-    if a == 2 and b == 2 and info["f_local"] == RECURRENCES["2T(n/2) + n   (guess: n log n)"]["f_local"]:
+    a, b, f_local, f_vec = info["a"], info["b"], info["f_local"], info["f_vec"]
+    # Every level at once: a^i nodes of size n/b^i
+    levels = int(math.log(n) / math.log(b)) + 1
+    xs = np.arange(levels)
+    sizes = np.maximum(n // np.power(b, xs), 1)
+    vals = np.power(a, xs) * f_vec(sizes)
+    if a == 2 and b == 2 and f_local == RECURRENCES["2T(n/2) + n   (guess: n log n)"]["f_local"]:
         msg = "Balanced across levels (Case 2 style)"
     elif a == 1 and b == 2:
         msg = "Top-heavy (root dominates)"
     else:
         msg = "Slightly top-skewed (extra log factor)"
-    return xs, np.array(vals, dtype=float), msg
+    for column in (xs, vals):
+        column.setflags(write=False)
+    return xs, vals, msg
 
 # ----------------------------
 # Dash App (viewport-stable layout)
@@ -192,14 +241,15 @@ app.layout = html.Div(
                         html.Div(style={"height": "12px"}),
 
                         html.Label("Max n (2^k)", style={"fontWeight": 600}),
-                        dcc.Slider(id="k", min=3, max=12, step=1, value=8,
-                                   marks={i: f"{i}" for i in range(3, 13)}),
+                        dcc.Slider(id="k", min=K_MIN, max=K_MAX, step=1, value=8,
+                                   marks={i: f"{i}" for i in range(K_MIN, K_MAX + 1)}),
 
                         html.Div(style={"height": "10px"}),
 
                         html.Label("c (for bound: c·g(n))", style={"fontWeight": 600}),
                         dcc.Slider(
                             id="c", min=0.25, max=6.0, step=0.05,
+                            updatemode="mouseup",  # one callback per drag, not per tick
                             value=RECURRENCES[opts[0]["value"]]["suggested_c"],
                             tooltip={"placement": "bottom", "always_visible": False},
                         ),
@@ -251,19 +301,22 @@ app.layout = html.Div(
     ],
 )
 
+@app.callback(
+    Output("proof", "children"),
+    Input("recurrence", "value"),
+)
+def update_proof(key: str):
+    return PROOF_TEXT[key]
+
 @app.callback(
     Output("graph", "figure"),
     Output("status", "children"),
-    Output("proof", "children"),
     Input("recurrence", "value"),
     Input("k", "value"),
     Input("c", "value"),
     Input("view", "value"),
 )
 def update_all(key: str, k: int, c: float, view: str):
-    # Proof text (left panel)
-    proof_text = "\n".join(RECURRENCES[key]["proof"])
-
     if view == "work":
         # Work-by-level figure (fills container height; no page growth)
         wx, wvals, msg = work_by_level(key, k)
@@ -272,30 +325,49 @@ def update_all(key: str, k: int, c: float, view: str):
             title=f"Work by Level — {msg}",
             margin=dict(l=40, r=10, t=40, b=40),
             legend=dict(orientation="h", y=1.02, x=0),
+            uirevision=f"{key}-{k}-{view}",
         )
         status = "Work distribution across recursion levels."
-        return fig, status, proof_text
-
-    # Main plot
-    xs, T_vals, B_vals = series(key, k, float(c))
-    ok = T_vals <= B_vals
+        return fig, status
+
+    # Main plot: domain, T(n) and g(n) come from the server-side caches,
+    # so a c change only rescales g
+    xs, T_vals = T_series(key, k)
+    B_vals = round(float(c), 2) * g_series(key, k)
+    bad = T_vals > B_vals
+    all_ok = not bad.any()
+    fail_x, fail_y = xs[bad], T_vals[bad]
+    status = "✓ Bound holds for all shown n." if all_ok \
+        else f"✗ Bound fails for some n (first n={fail_x[0]}). Try increasing c."
+
+    if ctx.triggered_id == "c":
+        # Only the bound moved: patch the figure already on screen instead
+        # of resending the domain and T(n)
+        fig = Patch()
+        fig["data"][1]["y"] = B_vals.tolist()
+        fig["data"][2]["x"] = fail_x.tolist()
+        fig["data"][2]["y"] = fail_y.tolist()
+        fig["data"][2]["visible"] = not all_ok
+        return fig, status
+
+    # The failure markers trace is always present (hidden when empty) so the
+    # patch above can address it by index
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=xs, y=T_vals, mode="lines", name="T(n) actual"))
-    fig.add_trace(go.Scatter(x=xs, y=B_vals, mode="lines", line=dict(dash="dash"), name="c·g(n)"))
-    if np.any(~ok):
-        fig.add_trace(go.Scatter(
-            x=xs[~ok], y=T_vals[~ok], mode="markers",
-            marker=dict(size=7), name="fails bound (T > c·g)"
-        ))
+    fig.add_trace(go.Scattergl(x=xs, y=T_vals, mode="lines", name="T(n) actual"))
+    fig.add_trace(go.Scattergl(x=xs, y=B_vals, mode="lines", line=dict(dash="dash"), name="c·g(n)"))
+    fig.add_trace(go.Scattergl(
+        x=fail_x, y=fail_y, mode="markers", visible=not all_ok,
+        marker=dict(size=7), name="fails bound (T > c·g)"
+    ))
     fig.update_layout(
         margin=dict(l=40, r=10, t=40, b=40),
         legend=dict(orientation="h", y=1.02, x=0),
         xaxis_title="n",
         yaxis_title="Work / Bound",
+        # Zoom and pan survive c changes; a new recurrence, k or tab resets them
+        uirevision=f"{key}-{k}-{view}",
     )
-    status = "✓ Bound holds for all shown n." if np.all(ok) \
-        else f"✗ Bound fails for some n (first n={int(xs[np.argmax(~ok)])}). Try increasing c."
-    return fig, status, proof_text
+    return fig, status
 
 if __name__ == "__main__":
     # Dash >=2.16 uses app.run; older versions still accept run_server.
@@ -1,4 +1,5 @@
 import math 
+from functools import lru_cache
 
 def substitution_method_demo():
     """
@@ -36,23 +37,24 @@ def substitution_method_demo():
         print("n    | T(n) actual | cn log n | Valid?")
         print("-" * 45)
         
+        @lru_cache(maxsize=None)
         def T(n):
             if n <= 1:
                 return 1
             return 2 * T(n // 2) + n
         
+        rows = []
         for n in n_values:
             actual = T(n)
             bound = c * n * math.log2(n) if n > 1 else c
             valid = "✓" if actual <= bound else "✗"
-            print(f"{n:4} | {actual:11.1f} | {bound:8.1f} | {valid}")
+            rows.append(f"{n:4} | {actual:11.1f} | {bound:8.1f} | {valid}")
+        print("\n".join(rows))
     
     verify_substitution([2, 4, 8, 16, 32, 64])
     
     print("\n✓ Substitution method confirms: T(n) = O(n log n)")
 
-substitution_method_demo()
-
 def substitution_method_detailed():
     """
     More detailed substitution method with different complexities
@@ -98,4 +100,6 @@ def substitution_method_detailed():
     print("\nRevised guess: T(n) = O(n log² n)")
     print("✓ This would work (left as exercise)")
 
-substitution_method_detailed()
\ No newline at end of file
+if __name__ == "__main__":
+    substitution_method_demo()
+    substitution_method_detailed()